@@ -19,18 +19,48 @@ Quick Start:
     ```
 """
 
-from pmm_agent.agent import (
-    create_pmm_agent,
-    evaluate_homepage,
-    create_positioning,
-    compare_competitors,
-    agent,
-)
+import importlib
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pmm_agent.agent import (
+        compare_competitors,
+        create_pmm_agent,
+        create_positioning,
+        evaluate_homepage,
+        evaluate_homepages,
+    )
 
 __all__ = [
     "create_pmm_agent",
     "evaluate_homepage",
+    "evaluate_homepages",
     "create_positioning",
     "compare_competitors",
-    "agent",
+    "agent",  # noqa: F822 - the default graph, resolved by __getattr__
 ]
+
+
+class _Package(ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing the pmm_agent.agent submodule binds it here as `agent`.
+        # That name is the default graph, so skip the binding and let
+        # __getattr__ serve it.
+        if name == "agent" and isinstance(value, ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+
+def __getattr__(name: str) -> Any:
+    # Exports load pmm_agent.agent (and LangChain) on first access, so
+    # importing the package or one of its submodules stays cheap
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module("pmm_agent.agent"), name)
+    globals()[name] = value
+    return value
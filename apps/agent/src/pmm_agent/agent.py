@@ -17,36 +17,46 @@ Based on proven PMM frameworks:
 """
 
 import os
-from typing import Literal
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from copy import deepcopy
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, Literal, TypedDict, overload
+from urllib.parse import urlsplit, urlunsplit
 
-from deepagents import create_deep_agent
-from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import BaseMessage
 
 from pmm_agent.prompts import PMM_EVALUATOR_SYSTEM_PROMPT
+from pmm_agent.subagents.dispatch import ParallelSubagentRouter
 from pmm_agent.subagents.specialists import PMM_SUBAGENTS
+from pmm_agent.tools.creation import (
+    create_homepage_wireframe,
+    create_messaging_framework,
+    create_positioning_canvas,
+    generate_differentiation_statements,
+)
 from pmm_agent.tools.evaluation import (
-    run_five_second_test,
-    analyze_positioning,
-    analyze_messaging,
     analyze_homepage_structure,
+    analyze_icp,
+    analyze_messaging,
+    analyze_positioning,
+    build_competitive_frame,
     detect_anti_patterns,
     generate_rewrite,
-    build_competitive_frame,
-    analyze_icp,
     run_complete_pmm_audit,
+    run_five_second_test,
 )
 from pmm_agent.tools.web import (
-    fetch_homepage,
-    fetch_competitor_homepage,
     analyze_landing_page,
+    fetch_competitor_homepage,
+    fetch_homepage,
     scrape_social_proof,
 )
-from pmm_agent.tools.creation import (
-    create_positioning_canvas,
-    create_messaging_framework,
-    create_homepage_wireframe,
-    generate_differentiation_statements,
-)
+
+if TYPE_CHECKING:
+    from langchain_anthropic import ChatAnthropic
 
 
 # =============================================================================
@@ -56,30 +66,54 @@ from pmm_agent.tools.creation import (
 # Default model - Claude Sonnet 4 for balanced performance
 DEFAULT_MODEL = "claude-sonnet-4-20250514"
 
+# Default output budget per model call
+DEFAULT_MAX_TOKENS = 20000
+
+# Upper bound on tool calls from one model turn that run at the same time
+MAX_TOOL_CONCURRENCY = 8
 
-def get_model(model_name: str | None = None) -> ChatAnthropic:
+
+def get_model(
+    model_name: str | None = None,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+) -> "ChatAnthropic":
     """Get a ChatAnthropic model instance.
 
+    Instances are cached per (model name, max_tokens). langchain-anthropic
+    already shares one pooled httpx client across instances with the same
+    connection settings, so keep-alive connections are reused session-wide.
+
     Args:
         model_name: Model name (e.g., "claude-sonnet-4-20250514").
                    If None, uses DEFAULT_MODEL.
+        max_tokens: Maximum tokens per response
 
     Returns:
-        ChatAnthropic instance
+        ChatAnthropic instance, shared by every caller with the same settings
     """
-    name = model_name or DEFAULT_MODEL
-    return ChatAnthropic(model_name=name, max_tokens=20000)
+    return _get_model(model_name or DEFAULT_MODEL, max_tokens)
+
+
+@lru_cache(maxsize=8)
+def _get_model(name: str, max_tokens: int) -> "ChatAnthropic":
+    from langchain_anthropic import ChatAnthropic
+
+    return ChatAnthropic(model_name=name, max_tokens=max_tokens)
+
 
 # Detect if running in LangGraph API environment
 running_in_langgraph_api = os.getenv("LANGGRAPH_API_URL") is not None
 
+# Checkpointer used when memory is on: local for the CLI, none for LangGraph API
+_CHECKPOINTER_DEFAULT: Final = None if running_in_langgraph_api else True
+
 
 # =============================================================================
 # TOOL REGISTRY
 # =============================================================================
 
 # Evaluation tools - for analyzing existing assets
-EVALUATION_TOOLS = [
+EVALUATION_TOOLS = (
     run_five_second_test,
     analyze_positioning,
     analyze_messaging,
@@ -89,32 +123,50 @@ EVALUATION_TOOLS = [
     build_competitive_frame,
     analyze_icp,
     run_complete_pmm_audit,
-]
+)
 
 # Web tools - for fetching and analyzing live sites
-WEB_TOOLS = [
+WEB_TOOLS = (
     fetch_homepage,
     fetch_competitor_homepage,
     analyze_landing_page,
     scrape_social_proof,
-]
+)
 
 # Creation tools - for generating PMM assets
-CREATION_TOOLS = [
+CREATION_TOOLS = (
     create_positioning_canvas,
     create_messaging_framework,
     create_homepage_wireframe,
     generate_differentiation_statements,
-]
+)
 
 # All tools combined
 ALL_TOOLS = EVALUATION_TOOLS + WEB_TOOLS + CREATION_TOOLS
 
+# Tool set for each operating mode, built once at import
+_TOOL_BUNDLES = {
+    "evaluate": EVALUATION_TOOLS + WEB_TOOLS,
+    "create": CREATION_TOOLS,
+    "full": ALL_TOOLS,
+}
+
+
+# Human-in-the-loop for high-stakes outputs (tool name -> interrupt)
+INTERRUPT_ON: Final = MappingProxyType(
+    {
+        "create_positioning_canvas": True,  # Review positioning before finalizing
+        "create_messaging_framework": True,  # Review messaging before finalizing
+        "create_homepage_wireframe": True,  # Review wireframe before delivery
+    }
+)
+
 
 # =============================================================================
 # AGENT FACTORY
 # =============================================================================
 
+
 def create_pmm_agent(
     model: str | None = None,
     mode: Literal["evaluate", "create", "full"] = "full",
@@ -135,7 +187,8 @@ def create_pmm_agent(
         include_subagents: Whether to include specialist subagents
 
     Returns:
-        A LangGraph StateGraph configured for PMM evaluation
+        A LangGraph StateGraph configured for PMM evaluation. Graphs are
+        compiled once per argument combination and reused on later calls.
 
     Example:
         ```python
@@ -148,77 +201,313 @@ def create_pmm_agent(
         })
         ```
     """
+    return _build_pmm_agent(model or DEFAULT_MODEL, mode, use_memory, include_subagents)
+
+
+@lru_cache(maxsize=8)
+def _build_pmm_agent(
+    model: str,
+    mode: Literal["evaluate", "create", "full"],
+    use_memory: bool,
+    include_subagents: bool,
+):
+    from deepagents import create_deep_agent
+
     # Select tools based on mode
-    if mode == "evaluate":
-        tools = EVALUATION_TOOLS + WEB_TOOLS
-    elif mode == "create":
-        tools = CREATION_TOOLS
-    else:  # "full"
-        tools = ALL_TOOLS
+    tools = _TOOL_BUNDLES.get(mode, ALL_TOOLS)
 
-    # Configure subagents
-    subagents = PMM_SUBAGENTS if include_subagents else []
+    # Configure subagents; those spawned in the same turn run in parallel.
+    # Their prompts are read here, on first build, rather than at import.
+    subagents = [subagent.as_dict() for subagent in PMM_SUBAGENTS] if include_subagents else []
+    middleware = [ParallelSubagentRouter()] if include_subagents else []
 
     # Get model instance
     model_instance = get_model(model)
 
-    # Create the Deep Agent
+    # Create the Deep Agent. Tool calls emitted in the same model turn run
+    # concurrently, bounded by MAX_TOOL_CONCURRENCY.
     return create_deep_agent(
         model=model_instance,
         tools=tools,
         subagents=subagents,
         system_prompt=PMM_EVALUATOR_SYSTEM_PROMPT,
-        # Memory handling: local checkpointer for CLI, none for LangGraph API
-        checkpointer=True if (use_memory and not running_in_langgraph_api) else None,
-        # Human-in-the-loop for high-stakes outputs (dict format required)
-        interrupt_on={
-            "create_positioning_canvas": True,   # Review positioning before finalizing
-            "create_messaging_framework": True,  # Review messaging before finalizing
-            "create_homepage_wireframe": True,   # Review wireframe before delivery
-        },
-    )
+        middleware=middleware,
+        checkpointer=_CHECKPOINTER_DEFAULT if use_memory else None,
+        # Human-in-the-loop for high-stakes outputs
+        interrupt_on=INTERRUPT_ON,
+    ).with_config({"max_concurrency": MAX_TOOL_CONCURRENCY})
 
 
 # =============================================================================
 # DEFAULT AGENT INSTANCE
 # =============================================================================
 
-# Create the default agent for LangGraph deployment
-agent = create_pmm_agent()
+
+def __getattr__(name: str) -> Any:
+    # The default agent for LangGraph deployment (langgraph.json points at
+    # `agent.py:agent`) is built on first access rather than at import, so
+    # the CLI and quick-start helpers don't pay for an extra graph build.
+    if name == "agent":
+        return create_pmm_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# =============================================================================
+# AGENT INPUT
+# =============================================================================
+
+
+class AgentInput(TypedDict):
+    """Input payload accepted by the PMM agent graph."""
+
+    messages: list[dict]
+
+
+# (message chunk, metadata) pairs from agent.stream(stream_mode="messages")
+_MessageStream = Iterator[tuple[Any, dict[str, Any]]]
+
+
+def _canonical_url(url: str) -> str:
+    """Normalize a URL so equivalent spellings build identical prompts."""
+    parts = urlsplit(url.strip())
+    return urlunsplit(parts._replace(scheme=parts.scheme.lower(), netloc=parts.netloc.lower()))
+
+
+def build_input(content: str) -> AgentInput:
+    """Build the agent input for a single user message.
+
+    Prompts are stripped, so identical prompts produce identical messages.
+    Each call builds its own message list and dicts.
+    """
+    # Plain string content: the caching middleware's rolling breakpoint already
+    # covers the latest message, and Anthropic rejects more than 4 breakpoints
+    return {"messages": [{"role": "user", "content": content.strip()}]}
+
+
+# =============================================================================
+# CACHE METRICS
+# =============================================================================
+
+# Anthropic bills cache writes and reads relative to the base input price
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.1
+
+
+class CacheUsage(TypedDict):
+    """Prompt-cache token counts summed over an agent run."""
+
+    input_tokens: int
+    cache_creation_tokens: int
+    cache_read_tokens: int
+    output_tokens: int
+    billed_input_tokens: float
+
+
+def cache_usage(messages: list[BaseMessage]) -> CacheUsage:
+    """
+    Sum the prompt-cache usage reported on an agent run's AI messages.
+
+    input_tokens includes cached tokens; billed_input_tokens converts the run
+    to base-price input tokens, so a run with no cache hits bills 1:1.
+
+    Args:
+        messages: The run's messages, e.g. result["messages"]
+
+    Returns:
+        Token totals for the run
+    """
+    input_tokens = cache_creation = cache_read = output_tokens = 0
+    for message in messages:
+        usage = getattr(message, "usage_metadata", None)
+        if not usage:
+            continue
+        details = usage.get("input_token_details", {})
+        input_tokens += usage["input_tokens"]
+        output_tokens += usage["output_tokens"]
+        cache_creation += details.get("cache_creation") or 0
+        cache_read += details.get("cache_read") or 0
+
+    uncached = input_tokens - cache_creation - cache_read
+    return {
+        "input_tokens": input_tokens,
+        "cache_creation_tokens": cache_creation,
+        "cache_read_tokens": cache_read,
+        "output_tokens": output_tokens,
+        "billed_input_tokens": (
+            uncached + cache_creation * CACHE_WRITE_MULTIPLIER + cache_read * CACHE_READ_MULTIPLIER
+        ),
+    }
 
 
 # =============================================================================
 # QUICK START FUNCTIONS
 # =============================================================================
 
-def evaluate_homepage(url: str, model: str | None = None) -> dict:
+# How long a homepage evaluation is reused before the agent runs again
+EVALUATION_CACHE_TTL = 15 * 60  # seconds
+
+# Most homepage evaluations kept; the least recently used are dropped first
+EVALUATION_CACHE_SIZE = 64
+
+# (url, model) -> (completed_at, result), least recently used first
+_EVALUATION_CACHE: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+
+
+# Homepage audits run at once by evaluate_homepages
+HOMEPAGE_BATCH_CONCURRENCY = 4
+
+
+def _homepage_audit_input(url: str) -> AgentInput:
+    return build_input(
+        f"Run a complete PMM audit on the homepage at {url}. "
+        f"Include 5-second test, positioning analysis, messaging analysis, "
+        f"and anti-pattern detection. Provide prioritized recommendations."
+    )
+
+
+def _cached_evaluation(key: tuple[str, str]) -> dict[str, Any] | None:
+    # Callers get their own copy, so mutating a result can't change what
+    # later callers see
+    cached = _EVALUATION_CACHE.get(key)
+    if cached is None:
+        return None
+    if time.monotonic() - cached[0] >= EVALUATION_CACHE_TTL:
+        del _EVALUATION_CACHE[key]
+        return None
+    _EVALUATION_CACHE.move_to_end(key)
+    return deepcopy(cached[1])
+
+
+def _store_evaluation(key: tuple[str, str], result: dict[str, Any], completed_at: float) -> None:
+    _EVALUATION_CACHE[key] = (completed_at, deepcopy(result))
+    _EVALUATION_CACHE.move_to_end(key)
+    while len(_EVALUATION_CACHE) > EVALUATION_CACHE_SIZE:
+        _EVALUATION_CACHE.popitem(last=False)
+
+
+@overload
+def evaluate_homepage(
+    url: str, model: str | None = None, stream: Literal[False] = False
+) -> dict[str, Any]: ...
+
+
+@overload
+def evaluate_homepage(
+    url: str, model: str | None = None, *, stream: Literal[True]
+) -> _MessageStream: ...
+
+
+def evaluate_homepage(
+    url: str,
+    model: str | None = None,
+    stream: bool = False,
+) -> dict[str, Any] | _MessageStream:
     """
     Quick function to evaluate a homepage.
 
+    Re-evaluating the same URL with the same model within
+    EVALUATION_CACHE_TTL returns the previous result without a new agent run.
+
     Args:
         url: The homepage URL to evaluate
         model: Model to use
+        stream: If True, return an iterator of (message chunk, metadata)
+                pairs as the agent produces them. Streamed runs are not cached.
 
     Returns:
         PMM evaluation results
     """
+    url = _canonical_url(url)
+    agent_input = _homepage_audit_input(url)
+    if stream:
+        chunks: _MessageStream = create_pmm_agent(model=model, mode="evaluate").stream(
+            agent_input, stream_mode="messages"
+        )
+        return chunks
+
+    key = (url, model or DEFAULT_MODEL)
+    cached = _cached_evaluation(key)
+    if cached is not None:
+        return cached
+
     agent = create_pmm_agent(model=model, mode="evaluate")
-    return agent.invoke({
-        "messages": [{
-            "role": "user",
-            "content": f"Run a complete PMM audit on the homepage at {url}. "
-                      f"Include 5-second test, positioning analysis, messaging analysis, "
-                      f"and anti-pattern detection. Provide prioritized recommendations."
-        }]
-    })
+    result: dict[str, Any] = agent.invoke(agent_input)
+    _store_evaluation(key, result, time.monotonic())
+    return result
+
 
+def evaluate_homepages(
+    urls: list[str],
+    model: str | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Evaluate several homepages in one batch.
 
+    Duplicate URLs and URLs with a cached evaluation are not re-run; the
+    rest run concurrently, HOMEPAGE_BATCH_CONCURRENCY at a time.
+
+    Args:
+        urls: Homepage URLs to evaluate
+        model: Model to use
+
+    Returns:
+        PMM evaluation results, in the order of urls
+    """
+    model = model or DEFAULT_MODEL
+    canonical = [_canonical_url(url) for url in urls]
+    results: dict[str, dict[str, Any]] = {}
+    pending: list[str] = []
+    for url in dict.fromkeys(canonical):
+        cached = _cached_evaluation((url, model))
+        if cached is None:
+            pending.append(url)
+        else:
+            results[url] = cached
+
+    if pending:
+        agent = create_pmm_agent(model=model, mode="evaluate")
+        outputs = agent.batch(
+            [_homepage_audit_input(url) for url in pending],
+            config={"max_concurrency": HOMEPAGE_BATCH_CONCURRENCY},
+        )
+        completed_at = time.monotonic()
+        for url, result in zip(pending, outputs, strict=True):
+            _store_evaluation((url, model), result, completed_at)
+            results[url] = result
+
+    # Every URL now has either a cached or a fresh result
+    assert results.keys() == set(canonical)
+    return [results[url] for url in canonical]
+
+
+@overload
 def create_positioning(
     product_description: str,
     target_audience: str | None = None,
     competitors: list[str] | None = None,
     model: str | None = None,
-) -> dict:
+    stream: Literal[False] = False,
+) -> dict[str, Any]: ...
+
+
+@overload
+def create_positioning(
+    product_description: str,
+    target_audience: str | None = None,
+    competitors: list[str] | None = None,
+    model: str | None = None,
+    *,
+    stream: Literal[True],
+) -> _MessageStream: ...
+
+
+def create_positioning(
+    product_description: str,
+    target_audience: str | None = None,
+    competitors: list[str] | None = None,
+    model: str | None = None,
+    stream: bool = False,
+) -> dict[str, Any] | _MessageStream:
     """
     Quick function to create positioning.
 
@@ -227,6 +516,8 @@ def create_positioning(
         target_audience: Who it's for
         competitors: Known competitors
         model: Model to use
+        stream: If True, return an iterator of (message chunk, metadata)
+                pairs as the agent produces them
 
     Returns:
         Positioning canvas and messaging framework
@@ -240,16 +531,39 @@ def create_positioning(
         prompt += f"\nCompetitors: {', '.join(competitors)}"
     prompt += "\n\nAfter the positioning canvas, also create a messaging framework."
 
-    return agent.invoke({
-        "messages": [{"role": "user", "content": prompt}]
-    })
+    agent_input = build_input(prompt)
+    if stream:
+        chunks: _MessageStream = agent.stream(agent_input, stream_mode="messages")
+        return chunks
+    result: dict[str, Any] = agent.invoke(agent_input)
+    return result
+
+
+@overload
+def compare_competitors(
+    your_url: str,
+    competitor_urls: list[str],
+    model: str | None = None,
+    stream: Literal[False] = False,
+) -> dict[str, Any]: ...
+
+
+@overload
+def compare_competitors(
+    your_url: str,
+    competitor_urls: list[str],
+    model: str | None = None,
+    *,
+    stream: Literal[True],
+) -> _MessageStream: ...
 
 
 def compare_competitors(
     your_url: str,
     competitor_urls: list[str],
     model: str | None = None,
-) -> dict:
+    stream: bool = False,
+) -> dict[str, Any] | _MessageStream:
     """
     Quick function to compare against competitors.
 
@@ -257,30 +571,34 @@ def compare_competitors(
         your_url: Your homepage URL
         competitor_urls: Competitor homepage URLs
         model: Model to use
+        stream: If True, return an iterator of (message chunk, metadata)
+                pairs as the agent produces them
 
     Returns:
         Competitive analysis with differentiation opportunities
     """
     agent = create_pmm_agent(model=model, mode="evaluate")
 
-    competitor_list = "\n".join([f"- {url}" for url in competitor_urls])
+    your_url = _canonical_url(your_url)
+    competitor_list = "\n".join([f"- {_canonical_url(url)}" for url in competitor_urls])
 
-    return agent.invoke({
-        "messages": [{
-            "role": "user",
-            "content": f"""Analyze my homepage ({your_url}) against these competitors:
+    agent_input = build_input(f"""Analyze my homepage ({your_url}) against these competitors:
 {competitor_list}
 
-For each competitor:
-1. Analyze their positioning and messaging
-2. Identify their weaknesses
-3. Find differentiation opportunities for me
+PLAN:
+1. Fetch my homepage and all {len(competitor_urls)} competitor homepages in parallel (single tool batch: `fetch_homepage` for mine, `fetch_competitor_homepage` for each competitor)
+2. For each fetched homepage, analyze positioning and messaging in parallel (single tool batch)
+3. For each competitor, identify their weaknesses and my differentiation opportunities
+4. Synthesize the comparison
 
 Then provide:
 - Overall competitive landscape summary
 - My unique positioning opportunities
 - "Unlike X, we Y" statements for each competitor
 - Recommended positioning angle
-"""
-        }]
-    })
+""")
+    if stream:
+        chunks: _MessageStream = agent.stream(agent_input, stream_mode="messages")
+        return chunks
+    result: dict[str, Any] = agent.invoke(agent_input)
+    return result
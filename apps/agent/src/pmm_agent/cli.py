@@ -6,9 +6,14 @@ Interactive command-line interface for evaluating and creating PMM assets.
 
 import os
 import sys
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -38,87 +43,113 @@ def print_welcome():
     print("=" * 60 + "\n")
 
 
-QUICK_PICKS = {
-    "1": "analyze_homepage",
-    "2": "five_second_test",
-    "3": "anti_patterns",
-    "4": "positioning_canvas",
-    "5": "messaging_framework",
-    "6": "competitor_compare",
+# Commands recognised in the prompt loop (matched case-insensitively)
+_EXIT_WORDS = frozenset({"exit", "quit", "q", "bye"})
+_HELP_WORDS = frozenset({"help", "?", "h"})
+
+
+def _positioning_canvas_prompt(product: str, audience: str, competitors: str) -> str:
+    prompt = f"Create a positioning canvas for: {product}"
+    if audience:
+        prompt += f"\nTarget audience: {audience}"
+    if competitors:
+        prompt += f"\nCompetitors: {competitors}"
+    return prompt
+
+
+class QuickPick(NamedTuple):
+    """A numbered quick pick: the inputs it asks for and the prompt it builds."""
+
+    build_prompt: Callable[..., str]
+    # (input label, required) for each value passed to build_prompt
+    inputs: tuple[tuple[str, bool], ...]
+    missing_message: str
+
+
+QUICK_PICKS: dict[str, QuickPick] = {
+    "1": QuickPick(
+        lambda url: (
+            f"Run a complete PMM audit on {url}. Include 5-second test, positioning analysis, messaging analysis, and anti-pattern detection."
+        ),
+        (("Enter homepage URL: ", True),),
+        "No URL provided.",
+    ),
+    "2": QuickPick(
+        lambda url: (
+            f"Run a 5-second test on {url}. Tell me: What do they do? Who is it for? What makes them different? What should I do next?"
+        ),
+        (("Enter URL to test: ", True),),
+        "No URL provided.",
+    ),
+    "3": QuickPick(
+        lambda url: (
+            f"Scan {url} for PMM anti-patterns. Look for: unclear positioning, jargon, feature dumping, missing social proof, too many CTAs."
+        ),
+        (("Enter URL to scan: ", True),),
+        "No URL provided.",
+    ),
+    "4": QuickPick(
+        _positioning_canvas_prompt,
+        (
+            ("Describe your product: ", True),
+            ("Who is it for? (optional): ", False),
+            ("Competitors? (optional, comma-separated): ", False),
+        ),
+        "No product description provided.",
+    ),
+    "5": QuickPick(
+        lambda product: (
+            f"Create a complete messaging framework for: {product}. Include value proposition, 3 key message pillars, and proof points."
+        ),
+        (("Describe your product: ", True),),
+        "No product description provided.",
+    ),
+    "6": QuickPick(
+        lambda your_url, competitor_url: (
+            f"Compare my homepage ({your_url}) against this competitor ({competitor_url}). Identify their weaknesses and my differentiation opportunities."
+        ),
+        (("Your homepage URL: ", True), ("Competitor URL: ", True)),
+        "Both URLs are required.",
+    ),
 }
 
 
-def handle_quick_pick(pick: str, agent) -> None:
-    """Handle quick pick selection."""
-    action = QUICK_PICKS.get(pick)
-
-    if action == "analyze_homepage":
-        url = input("Enter homepage URL: ").strip()
-        if not url:
-            print("No URL provided.")
-            return
-        prompt = f"Run a complete PMM audit on {url}. Include 5-second test, positioning analysis, messaging analysis, and anti-pattern detection."
-
-    elif action == "five_second_test":
-        url = input("Enter URL to test: ").strip()
-        if not url:
-            print("No URL provided.")
-            return
-        prompt = f"Run a 5-second test on {url}. Tell me: What do they do? Who is it for? What makes them different? What should I do next?"
-
-    elif action == "anti_patterns":
-        url = input("Enter URL to scan: ").strip()
-        if not url:
-            print("No URL provided.")
+def handle_quick_pick(action: QuickPick, agent: "CompiledStateGraph[Any, Any, Any, Any]") -> None:
+    """Handle quick pick selection for an entry from QUICK_PICKS."""
+    inputs = []
+    for label, required in action.inputs:
+        value = input(label).strip()
+        if required and not value:
+            print(action.missing_message)
             return
-        prompt = f"Scan {url} for PMM anti-patterns. Look for: unclear positioning, jargon, feature dumping, missing social proof, too many CTAs."
+        inputs.append(value)
 
-    elif action == "positioning_canvas":
-        product = input("Describe your product: ").strip()
-        if not product:
-            print("No product description provided.")
-            return
-        audience = input("Who is it for? (optional): ").strip()
-        competitors = input("Competitors? (optional, comma-separated): ").strip()
-
-        prompt = f"Create a positioning canvas for: {product}"
-        if audience:
-            prompt += f"\nTarget audience: {audience}"
-        if competitors:
-            prompt += f"\nCompetitors: {competitors}"
-
-    elif action == "messaging_framework":
-        product = input("Describe your product: ").strip()
-        if not product:
-            print("No product description provided.")
-            return
-        prompt = f"Create a complete messaging framework for: {product}. Include value proposition, 3 key message pillars, and proof points."
-
-    elif action == "competitor_compare":
-        your_url = input("Your homepage URL: ").strip()
-        competitor_url = input("Competitor URL: ").strip()
-        if not your_url or not competitor_url:
-            print("Both URLs are required.")
-            return
-        prompt = f"Compare my homepage ({your_url}) against this competitor ({competitor_url}). Identify their weaknesses and my differentiation opportunities."
+    run_prompt(agent, action.build_prompt(*inputs))
 
-    else:
-        print("Unknown action.")
-        return
 
-    run_prompt(agent, prompt)
+# Number of streamed chunks buffered between writes to stdout
+STREAM_FLUSH_EVERY = 64
 
 
-def run_prompt(agent, prompt: str) -> None:
-    """Run a prompt through the agent."""
+def run_prompt(agent: "CompiledStateGraph[Any, Any, Any, Any]", prompt: str) -> None:
+    """Run a prompt through the agent, printing the response as it streams."""
     print("\nAnalyzing...\n")
     try:
-        result = agent.invoke({
-            "messages": [{"role": "user", "content": prompt}]
-        })
-        response = result["messages"][-1].content
-        print(response)
-        print()
+        from langchain_core.messages import AIMessageChunk
+
+        from pmm_agent.agent import build_input
+
+        buffer: list[str] = []
+        for chunk, _metadata in agent.stream(build_input(prompt), stream_mode="messages"):
+            if isinstance(chunk, AIMessageChunk) and chunk.text:
+                buffer.append(chunk.text)
+                if len(buffer) >= STREAM_FLUSH_EVERY:
+                    sys.stdout.write("".join(buffer))
+                    sys.stdout.flush()
+                    buffer.clear()
+        sys.stdout.write("".join(buffer))
+        sys.stdout.flush()
+        print("\n")
     except Exception as e:
         print(f"\nError: {e}\n")
 
@@ -145,7 +176,8 @@ def main():
             user_input = input("You: ").strip()
 
             # Handle exit
-            if user_input.lower() in ("exit", "quit", "q", "bye"):
+            command = user_input.lower()
+            if command in _EXIT_WORDS:
                 print("\nGoodbye!")
                 break
 
@@ -153,13 +185,14 @@ def main():
                 continue
 
             # Handle help
-            if user_input.lower() in ("help", "?", "h"):
+            if command in _HELP_WORDS:
                 print_welcome()
                 continue
 
             # Handle quick picks
-            if user_input in QUICK_PICKS:
-                handle_quick_pick(user_input, agent)
+            action = QUICK_PICKS.get(user_input)
+            if action is not None:
+                handle_quick_pick(action, agent)
                 continue
 
             # Regular prompt
@@ -4,6 +4,14 @@ from pmm_agent.models.evaluation import (
     # Enums
     ScoreLevel,
     Severity,
+    AlternativeType,
+    StrategyType,
+    CanvasAlternativeType,
+    PositioningApproach,
+    MessagingLayerName,
+    Clarity,
+    IssueCategory,
+    AssetType,
     # Positioning
     CompetitiveAlternative,
     TargetCustomer,
@@ -29,6 +37,14 @@ __all__ = [
     # Enums
     "ScoreLevel",
     "Severity",
+    "AlternativeType",
+    "StrategyType",
+    "CanvasAlternativeType",
+    "PositioningApproach",
+    "MessagingLayerName",
+    "Clarity",
+    "IssueCategory",
+    "AssetType",
     # Positioning
     "CompetitiveAlternative",
     "TargetCustomer",
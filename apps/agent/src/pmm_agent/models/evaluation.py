@@ -7,10 +7,9 @@ Structured data models for PMM assessment based on proven frameworks:
 - Anti-Pattern Detection
 """
 
-from enum import IntEnum
-from typing import Literal
-from pydantic import BaseModel, Field
+from enum import IntEnum, StrEnum
 
+from pydantic import BaseModel, ConfigDict, Field
 
 # =============================================================================
 # SCORING ENUMS
@@ -33,19 +32,101 @@ class Severity(IntEnum):
     CRITICAL = 4 # Blocking, immediate attention required
 
 
+# =============================================================================
+# CATEGORY ENUMS
+# =============================================================================
+
+class AlternativeType(StrEnum):
+    """Kinds of competitive alternative."""
+    DIRECT_COMPETITOR = "direct_competitor"
+    MANUAL_PROCESS = "manual_process"
+    STATUS_QUO = "status_quo"
+    HOMEGROWN = "homegrown"
+    SPREADSHEETS = "spreadsheets"
+
+
+class StrategyType(StrEnum):
+    """Positioning strategy approaches."""
+    CATEGORY_BASED = "category_based"
+    USE_CASE_BASED = "use_case_based"
+    UNCLEAR = "unclear"
+
+
+class CanvasAlternativeType(StrEnum):
+    """Competitive alternatives a positioning canvas can be framed against."""
+    DIRECT_COMPETITOR = "direct_competitor"
+    MANUAL_PROCESS = "manual_process"
+    STATUS_QUO = "status_quo"
+    HOMEGROWN = "homegrown"
+
+
+class PositioningApproach(StrEnum):
+    """Strategy a positioning canvas commits to."""
+    CATEGORY_BASED = "category_based"
+    USE_CASE_BASED = "use_case_based"
+
+
+class MessagingLayerName(StrEnum):
+    """The 5 layers of the messaging hierarchy."""
+    POSITIONING_STATEMENT = "positioning_statement"
+    VALUE_PROPOSITION = "value_proposition"
+    KEY_MESSAGES = "key_messages"
+    PROOF_POINTS = "proof_points"
+    MICRO_COPY = "micro_copy"
+
+
+class Clarity(StrEnum):
+    """5-second test answer clarity."""
+    CLEAR = "clear"
+    PARTIAL = "partial"
+    UNCLEAR = "unclear"
+
+
+class IssueCategory(StrEnum):
+    """Area of the PMM stack an issue belongs to."""
+    POSITIONING = "positioning"
+    MESSAGING = "messaging"
+    HOMEPAGE = "homepage"
+    ICP = "icp"
+    GTM = "gtm"
+
+
+class AssetType(StrEnum):
+    """Marketing asset types that can be evaluated."""
+    HOMEPAGE = "homepage"
+    LANDING_PAGE = "landing_page"
+    SALES_DECK = "sales_deck"
+    EMAIL = "email"
+    AD = "ad"
+    OTHER = "other"
+
+
+# =============================================================================
+# BASE MODEL
+# =============================================================================
+
+class _PMMModel(BaseModel):
+    """Shared config for PMM models: schemas are built eagerly."""
+    model_config = ConfigDict(
+        defer_build=False,
+        arbitrary_types_allowed=False,
+        validate_assignment=False,
+    )
+
+
 # =============================================================================
 # POSITIONING MODELS
 # =============================================================================
 
-class CompetitiveAlternative(BaseModel):
+class CompetitiveAlternative(_PMMModel):
     """What you're positioning against."""
-    alternative_type: Literal["direct_competitor", "manual_process", "status_quo", "homegrown", "spreadsheets"]
+    alternative_type: AlternativeType
     name: str = Field(..., description="Name of the competitive alternative")
     pain_points: list[str] = Field(..., description="Why the alternative sucks")
     is_explicit: bool = Field(..., description="Is this explicitly stated or implied?")
 
 
-class TargetCustomer(BaseModel):
+class TargetCustomer(_PMMModel):
     """Who the positioning is for."""
     role_title: str | None = Field(None, description="Job role/title")
     company_type: str | None = Field(None, description="Type of company (B2B SaaS, agency, etc.)")
@@ -55,7 +136,7 @@ class TargetCustomer(BaseModel):
     specificity_score: int = Field(..., ge=0, le=100, description="How specific is the targeting?")
 
 
-class Differentiation(BaseModel):
+class Differentiation(_PMMModel):
     """What makes this different."""
     unique_approach: str | None = Field(None, description="How they do it differently")
     key_capability: str | None = Field(None, description="Unique capability")
@@ -64,9 +145,9 @@ class Differentiation(BaseModel):
     could_competitor_say_same: bool = Field(..., description="Could any competitor claim this?")
 
 
-class PositioningStrategy(BaseModel):
+class PositioningStrategy(_PMMModel):
     """Overall positioning approach."""
-    strategy_type: Literal["category_based", "use_case_based", "unclear"]
+    strategy_type: StrategyType
     category_or_use_case: str | None = Field(None, description="The category or use case")
     competitive_frame_score: int = Field(..., ge=0, le=100)
     target_audience_score: int = Field(..., ge=0, le=100)
@@ -74,7 +155,7 @@ class PositioningStrategy(BaseModel):
     problem_clarity_score: int = Field(..., ge=0, le=100)
 
 
-class PositioningAnalysis(BaseModel):
+class PositioningAnalysis(_PMMModel):
     """Complete positioning assessment."""
     target_customer: TargetCustomer
     competitive_alternative: CompetitiveAlternative | None
@@ -99,22 +180,16 @@ class PositioningAnalysis(BaseModel):
 # MESSAGING MODELS
 # =============================================================================
 
-class MessagingLayer(BaseModel):
+class MessagingLayer(_PMMModel):
     """Analysis of a single messaging layer."""
-    layer_name: Literal[
-        "positioning_statement",
-        "value_proposition",
-        "key_messages",
-        "proof_points",
-        "micro_copy"
-    ]
+    layer_name: MessagingLayerName
     present: bool = Field(..., description="Is this layer present?")
     quality_score: int = Field(..., ge=0, le=100)
     content_found: str | None = Field(None, description="What was found for this layer")
     issues: list[str] = Field(default_factory=list)
 
 
-class MessagingHouse(BaseModel):
+class MessagingHouse(_PMMModel):
     """The messaging house framework assessment."""
     value_proposition: str | None = Field(None, description="Top of house - value prop")
     pillars: list[str] = Field(default_factory=list, description="3 key message pillars")
@@ -124,7 +199,7 @@ class MessagingHouse(BaseModel):
     structure_score: int = Field(..., ge=0, le=100)
 
 
-class MessagingAnalysis(BaseModel):
+class MessagingAnalysis(_PMMModel):
     """Complete messaging assessment."""
     layers: list[MessagingLayer]
     messaging_house: MessagingHouse
@@ -148,18 +223,18 @@ class MessagingAnalysis(BaseModel):
 # HOMEPAGE/ASSET MODELS
 # =============================================================================
 
-class FiveSecondTest(BaseModel):
+class FiveSecondTest(_PMMModel):
     """The 5-second test assessment."""
-    what_they_do: Literal["clear", "partial", "unclear"]
-    who_its_for: Literal["clear", "partial", "unclear"]
-    whats_different: Literal["clear", "partial", "unclear"]
-    what_to_do_next: Literal["clear", "partial", "unclear"]
+    what_they_do: Clarity
+    who_its_for: Clarity
+    whats_different: Clarity
+    what_to_do_next: Clarity
 
     passed: bool = Field(..., description="Did they pass the 5-second test?")
     notes: str = Field(..., description="First impression notes")
 
 
-class HeroSection(BaseModel):
+class HeroSection(_PMMModel):
     """Hero section analysis."""
     headline: str | None
     subheadline: str | None
@@ -170,7 +245,7 @@ class HeroSection(BaseModel):
     cta_clarity_score: int = Field(..., ge=0, le=100)
 
 
-class SocialProof(BaseModel):
+class SocialProof(_PMMModel):
     """Social proof analysis."""
     logos_present: bool
     logos_recognizable: bool
@@ -182,7 +257,7 @@ class SocialProof(BaseModel):
     overall_score: int = Field(..., ge=0, le=100)
 
 
-class HomepageAnalysis(BaseModel):
+class HomepageAnalysis(_PMMModel):
     """Complete homepage assessment."""
     five_second_test: FiveSecondTest
     hero: HeroSection
@@ -208,9 +283,9 @@ class HomepageAnalysis(BaseModel):
 # ISSUE TRACKING
 # =============================================================================
 
-class PMMIssue(BaseModel):
+class PMMIssue(_PMMModel):
     """A specific PMM issue found during evaluation."""
-    category: Literal["positioning", "messaging", "homepage", "icp", "gtm"]
+    category: IssueCategory
     severity: Severity
     issue: str = Field(..., description="What's wrong")
     why_it_matters: str = Field(..., description="Impact of this issue")
@@ -219,9 +294,9 @@ class PMMIssue(BaseModel):
     location: str | None = Field(None, description="Where in the asset this appears")
 
 
-class PMMEvaluationResult(BaseModel):
+class PMMEvaluationResult(_PMMModel):
     """Complete PMM evaluation result."""
-    asset_type: Literal["homepage", "landing_page", "sales_deck", "email", "ad", "other"]
+    asset_type: AssetType
     asset_url: str | None = None
 
     # Component analyses
@@ -251,7 +326,7 @@ class PMMEvaluationResult(BaseModel):
 # POSITIONING CANVAS (Template for generation)
 # =============================================================================
 
-class PositioningCanvas(BaseModel):
+class PositioningCanvas(_PMMModel):
     """The positioning canvas template for creation/improvement."""
     # Section 1: Target Customer
     role_title: str
@@ -262,7 +337,7 @@ class PositioningCanvas(BaseModel):
 
     # Section 2: Competitive Alternative
     primary_alternative: str
-    alternative_type: Literal["direct_competitor", "manual_process", "status_quo", "homegrown"]
+    alternative_type: CanvasAlternativeType
 
     # Section 3: Why That Sucks
     pain_point_1: str
@@ -280,7 +355,7 @@ class PositioningCanvas(BaseModel):
     proof_point: str
 
     # Section 6: Strategy
-    positioning_approach: Literal["category_based", "use_case_based"]
+    positioning_approach: PositioningApproach
     category_or_use_case: str
 
     # Section 7: Statements
@@ -291,3 +366,8 @@ class PositioningCanvas(BaseModel):
     # Validation
     is_validated: bool = False
     validation_notes: str | None = None
+
+
+# Build every schema now so the first agent call doesn't pay for it
+PMMEvaluationResult.model_rebuild(force=True)
+PositioningCanvas.model_rebuild(force=True)
@@ -0,0 +1 @@
+"""Prompt text for the PMM agent and its subagents, loaded by pmm_agent.prompts."""
@@ -1,17 +1,48 @@
-"""PMM Specialist Subagents"""
+"""PMM Specialist Subagents
 
-from pmm_agent.subagents.specialists import (
-    PMM_SUBAGENTS,
-    positioning_analyst_subagent,
-    messaging_analyst_subagent,
-    homepage_analyst_subagent,
-    anti_pattern_detector_subagent,
-    icp_analyst_subagent,
-    competitive_analyst_subagent,
-)
+Exports resolve on first access, so importing one specialist only loads
+that specialist's module and tools.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pmm_agent.subagents.anti_pattern import anti_pattern_detector_subagent
+    from pmm_agent.subagents.base import Subagent
+    from pmm_agent.subagents.competitive import competitive_analyst_subagent
+    from pmm_agent.subagents.dispatch import ParallelSubagentRouter
+    from pmm_agent.subagents.homepage import homepage_analyst_subagent
+    from pmm_agent.subagents.icp import icp_analyst_subagent
+    from pmm_agent.subagents.messaging import messaging_analyst_subagent
+    from pmm_agent.subagents.positioning import positioning_analyst_subagent
+    from pmm_agent.subagents.specialists import (
+        PMM_SUBAGENT_ROUTER_MANIFEST,
+        PMM_SUBAGENTS,
+        PMM_SUBAGENTS_BY_NAME,
+    )
+
+# Export name -> submodule that defines it
+_EXPORTS = {
+    "ParallelSubagentRouter": "dispatch",
+    "PMM_SUBAGENTS": "specialists",
+    "PMM_SUBAGENT_ROUTER_MANIFEST": "specialists",
+    "PMM_SUBAGENTS_BY_NAME": "specialists",
+    "Subagent": "base",
+    "positioning_analyst_subagent": "positioning",
+    "messaging_analyst_subagent": "messaging",
+    "homepage_analyst_subagent": "homepage",
+    "anti_pattern_detector_subagent": "anti_pattern",
+    "icp_analyst_subagent": "icp",
+    "competitive_analyst_subagent": "competitive",
+}
 
 __all__ = [
+    "ParallelSubagentRouter",
     "PMM_SUBAGENTS",
+    "PMM_SUBAGENT_ROUTER_MANIFEST",
+    "PMM_SUBAGENTS_BY_NAME",
+    "Subagent",
     "positioning_analyst_subagent",
     "messaging_analyst_subagent",
     "homepage_analyst_subagent",
@@ -19,3 +50,13 @@ __all__ = [
     "icp_analyst_subagent",
     "competitive_analyst_subagent",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,33 @@
+"""
+PMM Anti-Pattern Detector Subagent
+"""
+
+from pmm_agent import prompts as _p
+from pmm_agent.subagents.base import Subagent
+from pmm_agent.tools.evaluation import (
+    detect_anti_patterns,
+    generate_rewrite,
+)
+
+anti_pattern_detector_subagent = Subagent(
+    name="anti-pattern-detector",
+    description="""Use this subagent to scan for PMM anti-patterns and mistakes.
+
+    Detects:
+    - Positioning anti-patterns (pigeonholing refusal, outcome-only, no frame)
+    - Messaging anti-patterns (jargon, feature dumps, clever over clear)
+    - Homepage anti-patterns (unclear hero, too many CTAs)
+    - ICP anti-patterns (too broad, aspirational)
+    - GTM anti-patterns (founder bias, sales-driven positioning)
+
+    Use for:
+    - "What anti-patterns exist in this asset?"
+    - "Scan for common PMM mistakes"
+    - "What's hurting conversion?"
+    """,
+    system_prompt=_p.LazyPrompt("ANTI_PATTERN_DETECTOR_PROMPT"),
+    tools=(
+        detect_anti_patterns,
+        generate_rewrite,
+    ),
+)
@@ -0,0 +1,51 @@
+"""
+PMM Subagent Record
+
+The Subagent dataclass shared by every specialist module.
+"""
+
+from dataclasses import dataclass, field
+from sys import intern
+from typing import TYPE_CHECKING, Any
+
+from pmm_agent import prompts as _p
+
+if TYPE_CHECKING:
+    from langchain_core.tools import BaseTool
+
+
+# =============================================================================
+# SUBAGENT RECORD
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class Subagent:
+    """A specialist subagent: routing description, prompt, and the tools it may call."""
+
+    name: str
+    description: str
+    system_prompt: str | _p.LazyPrompt
+    tools: tuple["BaseTool", ...]
+    # Names of the tools above, for membership checks
+    tool_set: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Dashed names aren't interned automatically; intern them so routing
+        # keys and dispatch tokens share one object
+        object.__setattr__(self, "name", intern(self.name))
+        object.__setattr__(self, "description", _p.normalize_prompt(self.description))
+        object.__setattr__(self, "tool_set", frozenset(tool.name for tool in self.tools))
+
+    def has_tool(self, tool_name: str) -> bool:
+        """Whether this subagent can call the named tool."""
+        return tool_name in self.tool_set
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the subagent spec in the dict shape deepagents expects."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "system_prompt": str(self.system_prompt),
+            "tools": list(self.tools),
+        }
@@ -0,0 +1,40 @@
+"""
+PMM Competitive Analyst Subagent
+"""
+
+from pmm_agent import prompts as _p
+from pmm_agent.subagents.base import Subagent
+from pmm_agent.tools.creation import (
+    generate_differentiation_statements,
+)
+from pmm_agent.tools.evaluation import (
+    analyze_positioning,
+    build_competitive_frame,
+)
+from pmm_agent.tools.web import (
+    fetch_competitor_homepage,
+)
+
+competitive_analyst_subagent = Subagent(
+    name="competitive-analyst",
+    description="""Use this subagent for competitive analysis and differentiation.
+
+    Specializes in:
+    - Competitor homepage analysis
+    - Competitive positioning gaps
+    - Differentiation opportunity identification
+    - "Unlike X, we Y" statement generation
+
+    Use for:
+    - "How do we position against [competitor]?"
+    - "What's our differentiation opportunity?"
+    - "Analyze this competitor's positioning"
+    """,
+    system_prompt=_p.LazyPrompt("COMPETITIVE_ANALYST_PROMPT"),
+    tools=(
+        fetch_competitor_homepage,
+        build_competitive_frame,
+        generate_differentiation_statements,
+        analyze_positioning,
+    ),
+)
@@ -0,0 +1,67 @@
+"""
+PMM Subagent Dispatch
+
+Runs specialist subagents launched in the same lead-agent turn in parallel.
+Each `task` tool call spawns one subagent with an isolated context, and the
+tool node executes all calls from one turn concurrently. This middleware caps
+how many subagents run at once to stay within Anthropic rate limits.
+"""
+
+import asyncio
+import threading
+import weakref
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from langchain.agents.middleware import AgentMiddleware
+from langchain.agents.middleware.types import ToolCallRequest
+from langchain_core.messages import ToolMessage
+from langgraph.types import Command
+
+# Name of the tool deepagents registers for spawning subagents
+SUBAGENT_TOOL_NAME = "task"
+
+# Maximum number of specialist subagents running at the same time
+MAX_SUBAGENT_CONCURRENCY = 5
+
+
+class ParallelSubagentRouter(AgentMiddleware):
+    """Bound concurrent subagent invocations within a single lead-agent turn."""
+
+    def __init__(self, max_concurrency: int = MAX_SUBAGENT_CONCURRENCY) -> None:
+        super().__init__()
+        self.max_concurrency = max_concurrency
+        self._sync_slots = threading.BoundedSemaphore(max_concurrency)
+        # The compiled graph holding this middleware is cached and shared
+        # across event loops, and an asyncio.Semaphore binds to the first loop
+        # that contends it, so each running loop gets its own
+        self._async_slots: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    def _loop_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        slots = self._async_slots.get(loop)
+        if slots is None:
+            slots = self._async_slots[loop] = asyncio.Semaphore(self.max_concurrency)
+        return slots
+
+    def wrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], ToolMessage | Command[Any]],
+    ) -> ToolMessage | Command[Any]:
+        if request.tool_call["name"] != SUBAGENT_TOOL_NAME:
+            return handler(request)
+        with self._sync_slots:
+            return handler(request)
+
+    async def awrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], Awaitable[ToolMessage | Command[Any]]],
+    ) -> ToolMessage | Command[Any]:
+        if request.tool_call["name"] != SUBAGENT_TOOL_NAME:
+            return await handler(request)
+        async with self._loop_slots():
+            return await handler(request)
@@ -0,0 +1,38 @@
+"""
+PMM Homepage Analyst Subagent
+"""
+
+from pmm_agent import prompts as _p
+from pmm_agent.subagents.base import Subagent
+from pmm_agent.tools.evaluation import (
+    detect_anti_patterns,
+    generate_rewrite,
+)
+from pmm_agent.tools.web import (
+    fetch_homepage,
+)
+
+homepage_analyst_subagent = Subagent(
+    name="homepage-analyst",
+    description="""Use this subagent when you need deep analysis of homepage structure and UX.
+
+    Specializes in:
+    - 5-second test execution
+    - Hero section effectiveness
+    - Information hierarchy assessment
+    - CTA strategy evaluation
+    - Social proof audit
+
+    Use for:
+    - "Does this homepage pass the 5-second test?"
+    - "Is the hero section effective?"
+    - "How's the CTA strategy?"
+    - "What social proof is missing?"
+    """,
+    system_prompt=_p.LazyPrompt("HOMEPAGE_ANALYST_PROMPT"),
+    tools=(
+        fetch_homepage,
+        detect_anti_patterns,
+        generate_rewrite,
+    ),
+)
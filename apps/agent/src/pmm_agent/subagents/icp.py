@@ -0,0 +1,34 @@
+"""
+PMM ICP Analyst Subagent
+"""
+
+from pmm_agent import prompts as _p
+from pmm_agent.subagents.base import Subagent
+from pmm_agent.tools.evaluation import (
+    analyze_icp,
+    detect_anti_patterns,
+)
+
+icp_analyst_subagent = Subagent(
+    name="icp-analyst",
+    description="""Use this subagent for Ideal Customer Profile analysis.
+
+    Specializes in:
+    - ICP specificity assessment
+    - Persona definition evaluation
+    - Situation/trigger identification
+    - Firmographic analysis
+    - Buyer vs. user distinction
+
+    Use for:
+    - "How specific is the ICP?"
+    - "Is the target audience well-defined?"
+    - "What triggers the buying decision?"
+    - "Are there too many personas?"
+    """,
+    system_prompt=_p.LazyPrompt("ICP_ANALYST_PROMPT"),
+    tools=(
+        analyze_icp,
+        detect_anti_patterns,
+    ),
+)
@@ -0,0 +1,36 @@
+"""
+PMM Messaging Analyst Subagent
+"""
+
+from pmm_agent import prompts as _p
+from pmm_agent.subagents.base import Subagent
+from pmm_agent.tools.evaluation import (
+    analyze_messaging,
+    detect_anti_patterns,
+    generate_rewrite,
+)
+
+messaging_analyst_subagent = Subagent(
+    name="messaging-analyst",
+    description="""Use this subagent when you need deep analysis of messaging.
+
+    Specializes in:
+    - Five-layer messaging hierarchy assessment
+    - Messaging house structure evaluation
+    - Clarity and specificity scoring
+    - Feature-to-benefit translation
+    - Copy rewriting for clarity
+
+    Use for:
+    - "Analyze the messaging layers"
+    - "Is the value proposition clear?"
+    - "Are features translated to benefits?"
+    - "Rewrite this jargon-filled copy"
+    """,
+    system_prompt=_p.LazyPrompt("MESSAGING_ANALYST_PROMPT"),
+    tools=(
+        analyze_messaging,
+        generate_rewrite,
+        detect_anti_patterns,
+    ),
+)
@@ -0,0 +1,44 @@
+"""
+PMM Positioning Analyst Subagent
+"""
+
+from pmm_agent import prompts as _p
+from pmm_agent.subagents.base import Subagent
+from pmm_agent.tools.creation import (
+    create_positioning_canvas,
+    generate_differentiation_statements,
+)
+from pmm_agent.tools.evaluation import (
+    analyze_positioning,
+    build_competitive_frame,
+)
+from pmm_agent.tools.web import (
+    fetch_competitor_homepage,
+)
+
+positioning_analyst_subagent = Subagent(
+    name="positioning-analyst",
+    description="""Use this subagent when you need deep analysis of positioning strategy.
+
+    Specializes in:
+    - Positioning Canvas analysis (April Dunford methodology)
+    - Competitive frame evaluation
+    - Target customer specificity assessment
+    - Differentiation meaningfulness and defensibility
+    - Category vs. use-case positioning decisions
+
+    Use for:
+    - "Analyze the positioning of this homepage"
+    - "Is the competitive frame clear?"
+    - "How specific is the target audience?"
+    - "Is the differentiation defensible?"
+    """,
+    system_prompt=_p.LazyPrompt("POSITIONING_ANALYST_PROMPT"),
+    tools=(
+        analyze_positioning,
+        build_competitive_frame,
+        create_positioning_canvas,
+        generate_differentiation_statements,
+        fetch_competitor_homepage,
+    ),
+)
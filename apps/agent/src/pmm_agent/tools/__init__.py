@@ -1,28 +1,29 @@
 """PMM Agent Tools"""
 
+from pmm_agent.tools._decorators import clear_tool_caches
+from pmm_agent.tools.creation import (
+    create_homepage_wireframe,
+    create_messaging_framework,
+    create_positioning_canvas,
+    generate_differentiation_statements,
+)
 from pmm_agent.tools.evaluation import (
-    run_five_second_test,
-    analyze_positioning,
-    analyze_messaging,
     analyze_homepage_structure,
+    analyze_icp,
+    analyze_messaging,
+    analyze_positioning,
+    build_competitive_frame,
     detect_anti_patterns,
     generate_rewrite,
-    build_competitive_frame,
-    analyze_icp,
     run_complete_pmm_audit,
+    run_five_second_test,
 )
 from pmm_agent.tools.web import (
-    fetch_homepage,
-    fetch_competitor_homepage,
     analyze_landing_page,
+    fetch_competitor_homepage,
+    fetch_homepage,
     scrape_social_proof,
 )
-from pmm_agent.tools.creation import (
-    create_positioning_canvas,
-    create_messaging_framework,
-    create_homepage_wireframe,
-    generate_differentiation_statements,
-)
 
 __all__ = [
     # Evaluation
@@ -45,4 +46,6 @@ __all__ = [
     "create_messaging_framework",
     "create_homepage_wireframe",
     "generate_differentiation_statements",
+    # Caching
+    "clear_tool_caches",
 ]
@@ -0,0 +1,106 @@
+"""
+Tool decorators shared by the PMM tool modules.
+"""
+
+import inspect
+import sys
+from collections.abc import Callable
+from functools import _CacheInfo, lru_cache, wraps
+from typing import Any, Protocol, cast
+
+from langchain_core.tools import BaseTool, tool
+
+from pmm_agent.tools._payload import collapse_whitespace
+
+# Results kept per tool; the tools are pure, so repeat calls are served from it
+TOOL_CACHE_SIZE = 512
+
+# Longest string argument interned in cache keys. URLs and Literal choices
+# recur across calls in a session; asset copy is long and rarely repeats.
+INTERN_MAX_LENGTH = 256
+
+# Arguments holding asset copy. Their whitespace is collapsed before the
+# cache lookup, so a re-fetched or re-pasted copy of an asset is a cache hit.
+ASSET_ARGUMENTS = frozenset({"asset_content"})
+
+# cache_clear of every pmm_tool result cache, for clear_tool_caches()
+_CACHE_CLEARERS: list[Callable[[], None]] = []
+
+
+class CachedToolFunction(Protocol):
+    """The function behind a pmm_tool, with its result cache's lru_cache controls."""
+
+    cache_info: Callable[[], _CacheInfo]
+    cache_clear: Callable[[], None]
+
+    def __call__(self, *args: Any, **kwargs: Any) -> str: ...
+
+
+def _freeze(value: object, asset: bool = False) -> object:
+    # Tool arguments are strings, bools, None or lists of strings
+    if isinstance(value, str):
+        if asset:
+            value = collapse_whitespace(value)
+        return sys.intern(value) if len(value) <= INTERN_MAX_LENGTH else value
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _thaw(value: object) -> object:
+    return list(value) if isinstance(value, tuple) else value
+
+
+def pmm_tool(func: Callable[..., str]) -> BaseTool:
+    """
+    Register a PMM tool with memoized sync and native async entry points.
+
+    The tools are pure functions of their arguments, so results are cached
+    per argument set; tool.func.cache_info() reports hits and misses. Asset
+    copy (ASSET_ARGUMENTS) reaches the tool with its whitespace collapsed, so
+    each result is built from exactly the text it is cached under. The
+    coroutine calls the same cached function directly. Without it,
+    ainvoke() hands every call to a thread pool.
+    """
+
+    asset_positions = frozenset(
+        [
+            position
+            for position, name in enumerate(inspect.signature(func).parameters)
+            if name in ASSET_ARGUMENTS
+        ]
+    )
+
+    @lru_cache(maxsize=TOOL_CACHE_SIZE)
+    def call(args: tuple[Any, ...], kwargs: tuple[tuple[str, Any], ...]) -> str:
+        return func(
+            *[_thaw(value) for value in args],
+            **{name: _thaw(value) for name, value in kwargs},
+        )
+
+    @wraps(func)
+    def lookup(*args: Any, **kwargs: Any) -> str:
+        frozen_kwargs = [
+            (name, _freeze(value, name in ASSET_ARGUMENTS)) for name, value in kwargs.items()
+        ]
+        return call(
+            tuple([_freeze(value, i in asset_positions) for i, value in enumerate(args)]),
+            tuple(sorted(frozen_kwargs)),
+        )
+
+    cached = cast(CachedToolFunction, lookup)
+    cached.cache_info = call.cache_info
+    cached.cache_clear = call.cache_clear
+    _CACHE_CLEARERS.append(call.cache_clear)
+
+    @wraps(func)
+    async def coroutine(*args: Any, **kwargs: Any) -> str:
+        return cached(*args, **kwargs)
+
+    registered = tool(cached)
+    registered.coroutine = coroutine
+    return registered
+
+
+def clear_tool_caches() -> None:
+    """Drop every memoized PMM tool result, e.g. between independent sessions."""
+    for cache_clear in _CACHE_CLEARERS:
+        cache_clear()
@@ -0,0 +1,113 @@
+"""
+JSON payload helpers for tool results.
+
+Tool results are JSON objects whose leading fields (task name and
+instructions) never change. Those are serialized once at import, and each
+call only serializes the fields that vary. The output is byte-identical to
+serializing the whole dict at once.
+
+orjson is used when installed (the "fast" extra); otherwise the stdlib json
+module, set to the same compact, non-ASCII-escaping format. Results are
+byte-identical with either encoder, so the cached prefix does not depend
+on which one is installed.
+"""
+
+import hashlib
+import json
+from collections.abc import Callable
+from string import Formatter
+
+try:
+    import orjson
+except ImportError:
+    _HAS_ORJSON = False
+else:
+    _HAS_ORJSON = True
+
+# orjson's output format: no spaces after separators, non-ASCII left as is
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_SEPARATOR = ","
+
+if _HAS_ORJSON:
+
+    def _dumps(value: object) -> str:
+        return orjson.dumps(value).decode()
+
+else:
+
+    def _dumps(value: object) -> str:
+        return _JSON_ENCODER.encode(value)
+
+
+# Results identify the asset instead of echoing it. The model already sent
+# the content as the tool call's argument, so repeating it in every result
+# only adds tokens.
+ASSET_REFERENCE = "The asset_content argument of this tool call"
+
+
+def collapse_whitespace(content: str) -> str:
+    """Collapse whitespace runs to single spaces and trim the ends."""
+    return " ".join(content.split())
+
+
+def asset_id(content: str) -> str:
+    """
+    Short content hash that identifies an asset across tool results.
+
+    Whitespace runs are collapsed first, so a re-fetched or re-pasted copy of
+    the same page keeps its id.
+    """
+    return hashlib.sha256(collapse_whitespace(content).encode()).hexdigest()[:16]
+
+
+def footer(*fields: tuple[str, object]) -> str:
+    """Render "Label: value" lines for the fields that were provided."""
+    return "\n".join([f"{label}: {value}" for label, value in fields if value])
+
+
+def json_prefix(**fields: object) -> str:
+    """Serialize the fixed leading fields as an unterminated JSON object."""
+    return _dumps(fields)[:-1]
+
+
+def json_text_prefix(**fields: object) -> str:
+    """Like json_prefix(), but leave the last field's string value open."""
+    return _dumps(fields)[:-2]
+
+
+def json_extend(prefix: str, /, **fields: object) -> str:
+    """Close a json_prefix() object with the per-call fields."""
+    if not fields:
+        return prefix + "}"
+    return f"{prefix}{_SEPARATOR}{_dumps(fields)[1:]}"
+
+
+def json_extend_text(prefix: str, text: str, /, **fields: object) -> str:
+    """Append text to a json_text_prefix() string, then close the object."""
+    return json_extend(prefix + _dumps(text)[1:], **fields)
+
+
+def json_format_prefix(template: str, /, **fields: object) -> Callable[..., str]:
+    """
+    Pre-escape a str.format() instructions template behind fixed fields.
+
+    Returns a function that fills the template's placeholders and gives a
+    json_prefix()-style prefix ending with the instructions field. Only the
+    filled-in values are escaped per call.
+    """
+    head = json_text_prefix(**fields, instructions="")
+    pieces = tuple(
+        (_dumps(literal)[1:-1], name)
+        for literal, name, _spec, _conversion in Formatter().parse(template)
+    )
+
+    def render(**values: object) -> str:
+        parts = [head]
+        for literal, name in pieces:
+            parts.append(literal)
+            if name is not None:
+                parts.append(_dumps(str(values[name]))[1:-1])
+        parts.append('"')
+        return "".join(parts)
+
+    return render
@@ -2,41 +2,18 @@
 PMM Creation Tools
 
 Tools for generating positioning, messaging, and marketing assets.
-"""
-
-import json
-from typing import Literal
-from langchain_core.tools import tool
 
+Results put the static instructions ahead of the per-call arguments, so the
+bytes before the arguments are identical on every call. The agent's rolling
+Anthropic cache breakpoint then reuses them as part of the cached prefix.
+"""
 
-@tool
-def create_positioning_canvas(
-    product_description: str,
-    target_audience: str | None = None,
-    known_competitors: list[str] | None = None,
-    unique_capabilities: list[str] | None = None,
-) -> str:
-    """
-    Create a complete positioning canvas for a product.
-
-    Uses April Dunford's positioning methodology to build:
-    - Target customer definition
-    - Competitive alternative
-    - Unique value proposition
-    - Positioning statements
+from typing import Final, Literal
 
-    Args:
-        product_description: What the product does
-        target_audience: Who it's for (if known)
-        known_competitors: List of competitors (if known)
-        unique_capabilities: What makes it different (if known)
+from pmm_agent.tools._decorators import pmm_tool
+from pmm_agent.tools._payload import footer, json_extend_text, json_text_prefix
 
-    Returns:
-        JSON with complete positioning canvas
-    """
-    return json.dumps({
-        "task": "create_positioning_canvas",
-        "instructions": f"""Create positioning canvas:
+_POSITIONING_CANVAS_INSTRUCTIONS: Final[str] = """Create positioning canvas:
 
 # POSITIONING CANVAS
 
@@ -140,43 +117,54 @@ def create_positioning_canvas(
 - [ ] Problem/pain is explicit
 - [ ] Could NOT be said by any competitor
 
-Product: {product_description}
-{f"Target: {target_audience}" if target_audience else ""}
-{f"Competitors: {known_competitors}" if known_competitors else ""}
-{f"Unique capabilities: {unique_capabilities}" if unique_capabilities else ""}""",
-        "product_description": product_description,
-        "target_audience": target_audience,
-        "known_competitors": known_competitors,
-        "unique_capabilities": unique_capabilities,
-    })
+"""
+_POSITIONING_CANVAS_PREFIX = json_text_prefix(
+    task="create_positioning_canvas",
+    instructions=_POSITIONING_CANVAS_INSTRUCTIONS,
+)
 
 
-@tool
-def create_messaging_framework(
-    positioning_canvas: str,
-    primary_persona: str | None = None,
-    secondary_personas: list[str] | None = None,
+@pmm_tool
+def create_positioning_canvas(
+    product_description: str,
+    target_audience: str | None = None,
+    known_competitors: list[str] | None = None,
+    unique_capabilities: list[str] | None = None,
 ) -> str:
     """
-    Create a messaging framework based on positioning.
+    Create a complete positioning canvas for a product.
 
-    Builds the messaging house with:
-    - Value proposition
-    - Key message pillars
-    - Proof points per pillar
-    - Persona-specific variations
+    Uses April Dunford's positioning methodology to build:
+    - Target customer definition
+    - Competitive alternative
+    - Unique value proposition
+    - Positioning statements
 
     Args:
-        positioning_canvas: The positioning canvas (from create_positioning_canvas)
-        primary_persona: Primary target persona
-        secondary_personas: Additional personas to message for
+        product_description: What the product does
+        target_audience: Who it's for (if known)
+        known_competitors: List of competitors (if known)
+        unique_capabilities: What makes it different (if known)
 
     Returns:
-        JSON with complete messaging framework
+        JSON with complete positioning canvas
     """
-    return json.dumps({
-        "task": "create_messaging_framework",
-        "instructions": f"""Create messaging framework:
+    return json_extend_text(
+        _POSITIONING_CANVAS_PREFIX,
+        footer(
+            ("Product", product_description),
+            ("Target", target_audience),
+            ("Competitors", known_competitors),
+            ("Unique capabilities", unique_capabilities),
+        ),
+        product_description=product_description,
+        target_audience=target_audience,
+        known_competitors=known_competitors,
+        unique_capabilities=unique_capabilities,
+    )
+
+
+_MESSAGING_FRAMEWORK_INSTRUCTIONS: Final[str] = """Create messaging framework:
 
 # MESSAGING FRAMEWORK
 
@@ -263,7 +251,7 @@ def create_messaging_framework(
 
 ## PERSONA-SPECIFIC MESSAGING
 
-{f"### Primary Persona: {primary_persona}" if primary_persona else "### Primary Persona"}
+### Primary Persona
 
 | Aspect | Message |
 |--------|---------|
@@ -274,7 +262,8 @@ def create_messaging_framework(
 | Likely Objection | |
 | Objection Response | |
 
-{f"### Secondary Personas: {secondary_personas}" if secondary_personas else ""}
+### Secondary Personas
+(Repeat the table for each secondary persona listed below, if any)
 
 ---
 
@@ -318,33 +307,50 @@ def create_messaging_framework(
 **10-second version:**
 
 
-Positioning: {positioning_canvas}""",
-        "positioning_canvas": positioning_canvas,
-        "primary_persona": primary_persona,
-        "secondary_personas": secondary_personas,
-    })
+"""
+_MESSAGING_FRAMEWORK_PREFIX = json_text_prefix(
+    task="create_messaging_framework",
+    instructions=_MESSAGING_FRAMEWORK_INSTRUCTIONS,
+)
 
 
-@tool
-def create_homepage_wireframe(
-    messaging_framework: str,
-    style: Literal["minimal", "standard", "comprehensive"] = "standard",
+@pmm_tool
+def create_messaging_framework(
+    positioning_canvas: str,
+    primary_persona: str | None = None,
+    secondary_personas: list[str] | None = None,
 ) -> str:
     """
-    Create a homepage wireframe with PMM best practices.
+    Create a messaging framework based on positioning.
 
-    Generates section-by-section copy recommendations based on messaging framework.
+    Builds the messaging house with:
+    - Value proposition
+    - Key message pillars
+    - Proof points per pillar
+    - Persona-specific variations
 
     Args:
-        messaging_framework: The messaging framework to translate
-        style: How detailed the homepage should be
+        positioning_canvas: The positioning canvas (from create_positioning_canvas)
+        primary_persona: Primary target persona
+        secondary_personas: Additional personas to message for
 
     Returns:
-        JSON with homepage wireframe and copy recommendations
+        JSON with complete messaging framework
     """
-    return json.dumps({
-        "task": "create_homepage_wireframe",
-        "instructions": f"""Create homepage wireframe:
+    return json_extend_text(
+        _MESSAGING_FRAMEWORK_PREFIX,
+        footer(
+            ("Primary persona", primary_persona),
+            ("Secondary personas", secondary_personas),
+            ("Positioning", positioning_canvas),
+        ),
+        positioning_canvas=positioning_canvas,
+        primary_persona=primary_persona,
+        secondary_personas=secondary_personas,
+    )
+
+
+_HOMEPAGE_WIREFRAME_INSTRUCTIONS: Final[str] = """Create homepage wireframe:
 
 # HOMEPAGE WIREFRAME
 
@@ -495,37 +501,39 @@ def create_homepage_wireframe(
 - [ ] No jargon or buzzwords
 - [ ] Scannable structure
 
-Style: {style}
-Messaging: {messaging_framework}""",
-        "messaging_framework": messaging_framework,
-        "style": style,
-    })
+"""
+_HOMEPAGE_WIREFRAME_PREFIX = json_text_prefix(
+    task="create_homepage_wireframe",
+    instructions=_HOMEPAGE_WIREFRAME_INSTRUCTIONS,
+)
 
 
-@tool
-def generate_differentiation_statements(
-    product_description: str,
-    competitive_alternative: str,
-    unique_capabilities: list[str],
-    target_audience: str | None = None,
+@pmm_tool
+def create_homepage_wireframe(
+    messaging_framework: str,
+    style: Literal["minimal", "standard", "comprehensive"] = "standard",
 ) -> str:
     """
-    Generate differentiation statements and positioning angles.
+    Create a homepage wireframe with PMM best practices.
 
-    Creates "Unlike X, we Y" statements and alternative positioning angles.
+    Generates section-by-section copy recommendations based on messaging framework.
 
     Args:
-        product_description: What the product does
-        competitive_alternative: What you're positioning against
-        unique_capabilities: What makes you different
-        target_audience: Who you're targeting
+        messaging_framework: The messaging framework to translate
+        style: How detailed the homepage should be
 
     Returns:
-        JSON with differentiation statements and positioning angles
+        JSON with homepage wireframe and copy recommendations
     """
-    return json.dumps({
-        "task": "generate_differentiation",
-        "instructions": f"""Generate differentiation statements:
+    return json_extend_text(
+        _HOMEPAGE_WIREFRAME_PREFIX,
+        footer(("Style", style), ("Messaging", messaging_framework)),
+        messaging_framework=messaging_framework,
+        style=style,
+    )
+
+
+_DIFFERENTIATION_INSTRUCTIONS: Final[str] = """Generate differentiation statements:
 
 # DIFFERENTIATION STATEMENTS
 
@@ -609,12 +617,44 @@ To test these with customers, ask:
 2. "Does this sound different from [competitor]?"
 3. "Would this make you want to learn more?"
 
-Product: {product_description}
-Alternative: {competitive_alternative}
-Capabilities: {unique_capabilities}
-{f"Audience: {target_audience}" if target_audience else ""}""",
-        "product_description": product_description,
-        "competitive_alternative": competitive_alternative,
-        "unique_capabilities": unique_capabilities,
-        "target_audience": target_audience,
-    })
+"""
+_DIFFERENTIATION_PREFIX = json_text_prefix(
+    task="generate_differentiation",
+    instructions=_DIFFERENTIATION_INSTRUCTIONS,
+)
+
+
+@pmm_tool
+def generate_differentiation_statements(
+    product_description: str,
+    competitive_alternative: str,
+    unique_capabilities: list[str],
+    target_audience: str | None = None,
+) -> str:
+    """
+    Generate differentiation statements and positioning angles.
+
+    Creates "Unlike X, we Y" statements and alternative positioning angles.
+
+    Args:
+        product_description: What the product does
+        competitive_alternative: What you're positioning against
+        unique_capabilities: What makes you different
+        target_audience: Who you're targeting
+
+    Returns:
+        JSON with differentiation statements and positioning angles
+    """
+    return json_extend_text(
+        _DIFFERENTIATION_PREFIX,
+        footer(
+            ("Product", product_description),
+            ("Alternative", competitive_alternative),
+            ("Capabilities", unique_capabilities),
+            ("Audience", target_audience),
+        ),
+        product_description=product_description,
+        competitive_alternative=competitive_alternative,
+        unique_capabilities=unique_capabilities,
+        target_audience=target_audience,
+    )
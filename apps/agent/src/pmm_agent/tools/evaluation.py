@@ -3,59 +3,38 @@ PMM Evaluation Tools
 
 Tools for analyzing positioning, messaging, and marketing assets.
 Following the Deep Agents framework pattern with @tool decorator.
+
+Results put the static instructions ahead of the per-call arguments, so the
+bytes before the arguments are identical on every call. The agent's rolling
+Anthropic cache breakpoint then reuses them as part of the cached prefix.
 """
 
-import json
-from typing import Literal
-from langchain_core.tools import tool
-
-from pmm_agent.models.evaluation import (
-    FiveSecondTest,
-    PositioningAnalysis,
-    TargetCustomer,
-    CompetitiveAlternative,
-    Differentiation,
-    PositioningStrategy,
-    MessagingAnalysis,
-    MessagingLayer,
-    MessagingHouse,
-    HomepageAnalysis,
-    HeroSection,
-    SocialProof,
-    PMMIssue,
-    Severity,
-)
+import re
+from types import MappingProxyType
+from typing import Final, Literal, get_args
+
+from pmm_agent.prompts import ANTI_PATTERN_SIGNS
+from pmm_agent.tools._decorators import pmm_tool
+from pmm_agent.tools._payload import ASSET_REFERENCE, asset_id, json_extend, json_prefix
+
+_AssetType = Literal["homepage", "landing_page", "sales_deck", "email", "ad"]
+_ScanAssetType = Literal["homepage", "landing_page", "sales_deck", "email", "ad", "all"]
+# Checked on entry, so direct .func() calls fail with a clear error instead of
+# a KeyError from the prefix tables
+_ASSET_TYPES: Final[frozenset[str]] = frozenset(get_args(_AssetType))
+_SCAN_ASSET_TYPES: Final[frozenset[str]] = frozenset(get_args(_ScanAssetType))
+
+# Results are laid out static -> semi-stable -> dynamic: the fixed
+# instructions, then arguments drawn from a small fixed set (asset types,
+# flags), then per-asset values. The first two layers are serialized for
+# every choice at import, so only the last is encoded per call.
 
 
 # =============================================================================
 # 5-SECOND TEST TOOL
 # =============================================================================
 
-@tool
-def run_five_second_test(
-    asset_content: str,
-    asset_type: Literal["homepage", "landing_page", "sales_deck", "email", "ad"] = "homepage",
-) -> str:
-    """
-    Run a 5-second test on a marketing asset.
-
-    The 5-second test answers four critical questions:
-    1. What does this company/product do?
-    2. Who is it for?
-    3. What makes it different?
-    4. What should I do next?
-
-    Args:
-        asset_content: The content of the marketing asset (text, HTML, or description)
-        asset_type: Type of asset being evaluated
-
-    Returns:
-        JSON with 5-second test results and pass/fail determination
-    """
-    # This tool returns a structured prompt for the LLM to complete
-    return json.dumps({
-        "task": "five_second_test",
-        "instructions": """Analyze this asset and answer:
+_FIVE_SECOND_TEST_INSTRUCTIONS: Final[str] = """Analyze this asset and answer:
 
 1. **What do they do?** (clear/partial/unclear)
    - Can you tell what the product/service is within 5 seconds?
@@ -75,41 +54,56 @@ def run_five_second_test(
 
 **Final verdict:** PASS (3-4 clear), PARTIAL (1-2 clear), FAIL (0 clear)
 
-Provide specific evidence for each answer.""",
-        "asset_content": asset_content,
-        "asset_type": asset_type,
-    })
+Provide specific evidence for each answer."""
+_FIVE_SECOND_TEST_PREFIXES = MappingProxyType(
+    {
+        asset_type: json_prefix(
+            task="five_second_test",
+            instructions=_FIVE_SECOND_TEST_INSTRUCTIONS,
+            asset=ASSET_REFERENCE,
+            asset_type=asset_type,
+        )
+        for asset_type in get_args(_AssetType)
+    }
+)
 
 
-# =============================================================================
-# POSITIONING ANALYSIS TOOL
-# =============================================================================
-
-@tool
-def analyze_positioning(
+@pmm_tool
+def run_five_second_test(
     asset_content: str,
-    company_context: str | None = None,
+    asset_type: _AssetType = "homepage",
 ) -> str:
     """
-    Analyze the positioning strategy of a marketing asset.
+    Run a 5-second test on a marketing asset.
 
-    Uses the Positioning Canvas framework:
-    1. Target Customer - Who is this for?
-    2. Competitive Alternative - What are you better than?
-    3. Why Alternative Sucks - Pain points of current solution
-    4. Unique Approach - How you do it differently
-    5. Why That's Better - Benefits of your approach
+    The 5-second test answers four critical questions:
+    1. What does this company/product do?
+    2. Who is it for?
+    3. What makes it different?
+    4. What should I do next?
 
     Args:
-        asset_content: The marketing asset content to analyze
-        company_context: Optional additional context about the company
+        asset_content: The content of the marketing asset (text, HTML, or description)
+        asset_type: Type of asset being evaluated
 
     Returns:
-        JSON with positioning analysis including scores and issues
+        JSON with 5-second test results and pass/fail determination
     """
-    return json.dumps({
-        "task": "positioning_analysis",
-        "instructions": """Analyze positioning using the Positioning Canvas:
+    if asset_type not in _ASSET_TYPES:
+        raise ValueError(f"Unknown asset_type: {asset_type!r}")
+    # This tool returns a structured prompt for the LLM to complete
+    return json_extend(
+        _FIVE_SECOND_TEST_PREFIXES[asset_type],
+        asset_id=asset_id(asset_content),
+    )
+
+
+# =============================================================================
+# POSITIONING ANALYSIS TOOL
+# =============================================================================
+
+_POSITIONING_ANALYSIS_INSTRUCTIONS: Final[str] = """\
+Analyze positioning using the Positioning Canvas:
 
 ## 1. TARGET CUSTOMER
 - Role/Title: (identified or missing?)
@@ -147,41 +141,48 @@ def analyze_positioning(
 ## OVERALL POSITIONING SCORE (0-100)
 - Weighted average of components
 - List top 3 strengths
-- List top 3 weaknesses""",
-        "asset_content": asset_content,
-        "company_context": company_context,
-    })
-
+- List top 3 weaknesses"""
+_POSITIONING_ANALYSIS_PREFIX = json_prefix(
+    task="positioning_analysis",
+    instructions=_POSITIONING_ANALYSIS_INSTRUCTIONS,
+    asset=ASSET_REFERENCE,
+)
 
-# =============================================================================
-# MESSAGING ANALYSIS TOOL
-# =============================================================================
 
-@tool
-def analyze_messaging(
+@pmm_tool
+def analyze_positioning(
     asset_content: str,
-    target_persona: str | None = None,
+    company_context: str | None = None,
 ) -> str:
     """
-    Analyze the messaging hierarchy of a marketing asset.
+    Analyze the positioning strategy of a marketing asset.
 
-    Evaluates the five layers of messaging:
-    1. Positioning Statement (internal)
-    2. Value Proposition (hero)
-    3. Key Messages (pillars)
-    4. Proof Points (evidence)
-    5. Micro-Copy (CTAs, buttons)
+    Uses the Positioning Canvas framework:
+    1. Target Customer - Who is this for?
+    2. Competitive Alternative - What are you better than?
+    3. Why Alternative Sucks - Pain points of current solution
+    4. Unique Approach - How you do it differently
+    5. Why That's Better - Benefits of your approach
 
     Args:
         asset_content: The marketing asset content to analyze
-        target_persona: Optional target persona for persona-specific analysis
+        company_context: Optional additional context about the company
 
     Returns:
-        JSON with messaging analysis including layer-by-layer assessment
+        JSON with positioning analysis including scores and issues
     """
-    return json.dumps({
-        "task": "messaging_analysis",
-        "instructions": """Analyze messaging using the 5-layer hierarchy:
+    return json_extend(
+        _POSITIONING_ANALYSIS_PREFIX,
+        asset_id=asset_id(asset_content),
+        company_context=company_context,
+    )
+
+
+# =============================================================================
+# MESSAGING ANALYSIS TOOL
+# =============================================================================
+
+_MESSAGING_ANALYSIS_INSTRUCTIONS: Final[str] = """Analyze messaging using the 5-layer hierarchy:
 
 ## LAYER 1: POSITIONING STATEMENT
 - Can you infer: "For [target] who [situation], [product] is a [category] that [benefit]. Unlike [alternative], we [differentiator]"?
@@ -233,41 +234,48 @@ Value Prop: [quote]
 - [ ] Saying Everything
 - [ ] No Specificity
 
-## OVERALL MESSAGING SCORE (0-100)""",
-        "asset_content": asset_content,
-        "target_persona": target_persona,
-    })
-
+## OVERALL MESSAGING SCORE (0-100)"""
+_MESSAGING_ANALYSIS_PREFIX = json_prefix(
+    task="messaging_analysis",
+    instructions=_MESSAGING_ANALYSIS_INSTRUCTIONS,
+    asset=ASSET_REFERENCE,
+)
 
-# =============================================================================
-# HOMEPAGE STRUCTURE TOOL
-# =============================================================================
 
-@tool
-def analyze_homepage_structure(
+@pmm_tool
+def analyze_messaging(
     asset_content: str,
-    include_screenshots: bool = False,
+    target_persona: str | None = None,
 ) -> str:
     """
-    Analyze the structure and UX of a homepage.
+    Analyze the messaging hierarchy of a marketing asset.
 
-    Evaluates:
-    - Hero section effectiveness
-    - Information hierarchy
-    - CTA strategy
-    - Social proof placement
-    - Visual structure
+    Evaluates the five layers of messaging:
+    1. Positioning Statement (internal)
+    2. Value Proposition (hero)
+    3. Key Messages (pillars)
+    4. Proof Points (evidence)
+    5. Micro-Copy (CTAs, buttons)
 
     Args:
-        asset_content: Homepage content (HTML, text, or description)
-        include_screenshots: Whether screenshot analysis is included
+        asset_content: The marketing asset content to analyze
+        target_persona: Optional target persona for persona-specific analysis
 
     Returns:
-        JSON with structural analysis and UX recommendations
+        JSON with messaging analysis including layer-by-layer assessment
     """
-    return json.dumps({
-        "task": "homepage_structure_analysis",
-        "instructions": """Analyze homepage structure:
+    return json_extend(
+        _MESSAGING_ANALYSIS_PREFIX,
+        asset_id=asset_id(asset_content),
+        target_persona=target_persona,
+    )
+
+
+# =============================================================================
+# HOMEPAGE STRUCTURE TOOL
+# =============================================================================
+
+_HOMEPAGE_STRUCTURE_INSTRUCTIONS: Final[str] = """Analyze homepage structure:
 
 ## HERO SECTION
 - **Headline:** Quote it. Is it clear or clever?
@@ -308,41 +316,92 @@ List each section with:
 - Effectiveness (0-100)
 - Issues
 
-## OVERALL HOMEPAGE SCORE (0-100)""",
-        "asset_content": asset_content,
-        "include_screenshots": include_screenshots,
-    })
-
+## OVERALL HOMEPAGE SCORE (0-100)"""
+_HOMEPAGE_STRUCTURE_PREFIXES = MappingProxyType(
+    {
+        include_screenshots: json_prefix(
+            task="homepage_structure_analysis",
+            instructions=_HOMEPAGE_STRUCTURE_INSTRUCTIONS,
+            asset=ASSET_REFERENCE,
+            include_screenshots=include_screenshots,
+        )
+        for include_screenshots in (False, True)
+    }
+)
 
-# =============================================================================
-# ANTI-PATTERN DETECTOR
-# =============================================================================
 
-@tool
-def detect_anti_patterns(
+@pmm_tool
+def analyze_homepage_structure(
     asset_content: str,
-    asset_type: Literal["homepage", "landing_page", "sales_deck", "email", "ad", "all"] = "all",
+    include_screenshots: bool = False,
 ) -> str:
     """
-    Scan a marketing asset for common PMM anti-patterns.
+    Analyze the structure and UX of a homepage.
 
-    Detects patterns across:
-    - Positioning mistakes
-    - Messaging mistakes
-    - Homepage mistakes
-    - ICP mistakes
-    - GTM mistakes
+    Evaluates:
+    - Hero section effectiveness
+    - Information hierarchy
+    - CTA strategy
+    - Social proof placement
+    - Visual structure
 
     Args:
-        asset_content: The marketing asset to scan
-        asset_type: Type of asset for context-appropriate detection
+        asset_content: Homepage content (HTML, text, or description)
+        include_screenshots: Whether screenshot analysis is included
 
     Returns:
-        JSON with detected anti-patterns, severity, and fixes
+        JSON with structural analysis and UX recommendations
     """
-    return json.dumps({
-        "task": "anti_pattern_detection",
-        "instructions": """Scan for PMM anti-patterns:
+    return json_extend(
+        _HOMEPAGE_STRUCTURE_PREFIXES[include_screenshots],
+        asset_id=asset_id(asset_content),
+    )
+
+
+# =============================================================================
+# ANTI-PATTERN DETECTOR
+# =============================================================================
+
+# Sign phrase (lowercased) -> anti-pattern it indicates
+_SIGN_PATTERNS = {
+    phrase.lower(): pattern for pattern, phrases in ANTI_PATTERN_SIGNS.items() for phrase in phrases
+}
+
+# Longest first, so the alternation prefers the longest phrase at a position
+_SIGN_PHRASES = tuple(sorted(_SIGN_PATTERNS, key=len, reverse=True))
+
+# All sign phrases as one alternation, so an asset is scanned in a single pass.
+# Matching runs against lowercased text, which is faster than IGNORECASE.
+# Each phrase is its own group: match.lastindex names the phrase even when
+# the matched text doesn't lowercase to it (IGNORECASE matches "ſ" as "s").
+_SIGN_ALTERNATION = r"\b(?:" + "|".join(f"({re.escape(p)})" for p in _SIGN_PHRASES) + r")\b"
+_SIGN_SCANNER = re.compile(_SIGN_ALTERNATION)
+_SIGN_SCANNER_IGNORECASE = re.compile(_SIGN_ALTERNATION, re.IGNORECASE)
+
+
+def scan_anti_pattern_signs(text: str) -> dict[str, list[str]]:
+    """Find known anti-pattern sign phrases in text, grouped by anti-pattern."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        matches = _SIGN_SCANNER.finditer(lowered)
+    else:
+        # Some characters change length when lowercased, so spans from the
+        # lowered text wouldn't line up with the original
+        matches = _SIGN_SCANNER_IGNORECASE.finditer(text)
+
+    hits: dict[str, list[str]] = {}
+    seen: set[str] = set()
+    for match in matches:
+        # Every alternative is a capture group, so a match always sets one
+        assert match.lastindex is not None
+        key = _SIGN_PHRASES[match.lastindex - 1]
+        if key not in seen:
+            seen.add(key)
+            hits.setdefault(_SIGN_PATTERNS[key], []).append(text[match.start() : match.end()])
+    return hits
+
+
+_ANTI_PATTERN_INSTRUCTIONS: Final[str] = """Scan for PMM anti-patterns:
 
 ## CRITICAL (Must Fix Immediately)
 
@@ -419,17 +478,83 @@ def detect_anti_patterns(
 - Critical issues: [count]
 - High priority: [count]
 - Medium: [count]
-- Top 3 to fix first:""",
-        "asset_content": asset_content,
-        "asset_type": asset_type,
-    })
+- Top 3 to fix first:"""
+_ANTI_PATTERN_PREFIXES = MappingProxyType(
+    {
+        asset_type: json_prefix(
+            task="anti_pattern_detection",
+            instructions=_ANTI_PATTERN_INSTRUCTIONS,
+            asset=ASSET_REFERENCE,
+            asset_type=asset_type,
+        )
+        for asset_type in get_args(_ScanAssetType)
+    }
+)
+
+
+@pmm_tool
+def detect_anti_patterns(
+    asset_content: str,
+    asset_type: _ScanAssetType = "all",
+) -> str:
+    """
+    Scan a marketing asset for common PMM anti-patterns.
+
+    Detects patterns across:
+    - Positioning mistakes
+    - Messaging mistakes
+    - Homepage mistakes
+    - ICP mistakes
+    - GTM mistakes
+
+    Args:
+        asset_content: The marketing asset to scan
+        asset_type: Type of asset for context-appropriate detection
+
+    Returns:
+        JSON with detected anti-patterns, severity, and fixes
+    """
+    if asset_type not in _SCAN_ASSET_TYPES:
+        raise ValueError(f"Unknown asset_type: {asset_type!r}")
+    return json_extend(
+        _ANTI_PATTERN_PREFIXES[asset_type],
+        asset_id=asset_id(asset_content),
+        # Verbatim sign phrases found by a literal scan; confirm each in context
+        sign_phrases_found=scan_anti_pattern_signs(asset_content),
+    )
 
 
 # =============================================================================
 # REWRITE GENERATOR
 # =============================================================================
 
-@tool
+# Fix approach for each generate_rewrite issue type
+_REWRITE_INSTRUCTIONS = MappingProxyType(
+    {
+        "unclear_headline": "Rewrite to clearly state WHAT + WHO. No cleverness.",
+        "jargon_buzzwords": "Replace all jargon with customer language. Be specific.",
+        "feature_dump": "Apply 'So what?' to each feature until you reach benefit.",
+        "no_specificity": "Add numbers, timeframes, concrete outcomes.",
+        "clever_over_clear": "Make it boring and clear. State exactly what it does.",
+        "weak_cta": "Make CTA benefit-oriented. What happens when they click?",
+        "generic_value_prop": "Add problem + specific solution + for whom.",
+        "no_competitive_frame": "Add 'Unlike X' or 'Instead of Y' framing.",
+    }
+)
+
+# Everything after the per-call header is the same for every rewrite
+_REWRITE_RESPONSE_FORMAT: Final[str] = """
+
+Provide:
+1. **Analysis:** Why the original fails
+2. **Rewrite Option 1:** Conservative improvement
+3. **Rewrite Option 2:** Bold improvement
+4. **Rewrite Option 3:** If persona specified, persona-specific version
+5. **Why these work:** Explanation of improvements"""
+_REWRITE_PREFIX = json_prefix(task="copy_rewrite")
+
+
+@pmm_tool
 def generate_rewrite(
     original_copy: str,
     issue_type: Literal[
@@ -457,71 +582,29 @@ def generate_rewrite(
     Returns:
         JSON with original, issue analysis, and rewritten alternatives
     """
-    rewrite_instructions = {
-        "unclear_headline": "Rewrite to clearly state WHAT + WHO. No cleverness.",
-        "jargon_buzzwords": "Replace all jargon with customer language. Be specific.",
-        "feature_dump": "Apply 'So what?' to each feature until you reach benefit.",
-        "no_specificity": "Add numbers, timeframes, concrete outcomes.",
-        "clever_over_clear": "Make it boring and clear. State exactly what it does.",
-        "weak_cta": "Make CTA benefit-oriented. What happens when they click?",
-        "generic_value_prop": "Add problem + specific solution + for whom.",
-        "no_competitive_frame": "Add 'Unlike X' or 'Instead of Y' framing.",
-    }
-
-    return json.dumps({
-        "task": "copy_rewrite",
-        "instructions": f"""Rewrite this copy to fix: {issue_type}
+    header = f"""Rewrite this copy to fix: {issue_type}
 
 **Original:**
 {original_copy}
 
 **Issue:** {issue_type}
-**Fix approach:** {rewrite_instructions.get(issue_type, "Improve clarity and specificity")}
+**Fix approach:** {_REWRITE_INSTRUCTIONS[issue_type]}
 
 **Target persona:** {target_persona or "Not specified"}
-**Competitive alternative:** {competitive_alternative or "Not specified"}
-
-Provide:
-1. **Analysis:** Why the original fails
-2. **Rewrite Option 1:** Conservative improvement
-3. **Rewrite Option 2:** Bold improvement
-4. **Rewrite Option 3:** If persona specified, persona-specific version
-5. **Why these work:** Explanation of improvements""",
-        "original_copy": original_copy,
-        "issue_type": issue_type,
-    })
+**Competitive alternative:** {competitive_alternative or "Not specified"}"""
+    return json_extend(
+        _REWRITE_PREFIX,
+        instructions="".join((header, _REWRITE_RESPONSE_FORMAT)),
+        original_copy=original_copy,
+        issue_type=issue_type,
+    )
 
 
 # =============================================================================
 # COMPETITIVE FRAME BUILDER
 # =============================================================================
 
-@tool
-def build_competitive_frame(
-    product_description: str,
-    known_competitors: list[str] | None = None,
-    current_positioning: str | None = None,
-) -> str:
-    """
-    Build a competitive frame for positioning.
-
-    Identifies what the product should be positioned against:
-    - Direct competitors
-    - Manual processes
-    - Status quo
-    - Homegrown solutions
-
-    Args:
-        product_description: Description of the product/service
-        known_competitors: List of known competitors if any
-        current_positioning: Current positioning if exists
-
-    Returns:
-        JSON with competitive frame options and recommendations
-    """
-    return json.dumps({
-        "task": "competitive_frame_building",
-        "instructions": """Build competitive frame:
+_COMPETITIVE_FRAME_INSTRUCTIONS: Final[str] = """Build competitive frame:
 
 ## COMPETITIVE ALTERNATIVES ANALYSIS
 
@@ -560,35 +643,49 @@ Generate 3 "Unlike X, we Y" statements:
 To validate this frame, ask customers:
 1.
 2.
-3.""",
-        "product_description": product_description,
-        "known_competitors": known_competitors,
-        "current_positioning": current_positioning,
-    })
-
+3."""
+_COMPETITIVE_FRAME_PREFIX = json_prefix(
+    task="competitive_frame_building",
+    instructions=_COMPETITIVE_FRAME_INSTRUCTIONS,
+)
 
-# =============================================================================
-# ICP ANALYZER
-# =============================================================================
 
-@tool
-def analyze_icp(
-    asset_content: str,
-    additional_context: str | None = None,
+@pmm_tool
+def build_competitive_frame(
+    product_description: str,
+    known_competitors: list[str] | None = None,
+    current_positioning: str | None = None,
 ) -> str:
     """
-    Analyze how well an asset defines and targets an Ideal Customer Profile.
+    Build a competitive frame for positioning.
+
+    Identifies what the product should be positioned against:
+    - Direct competitors
+    - Manual processes
+    - Status quo
+    - Homegrown solutions
 
     Args:
-        asset_content: Marketing asset to analyze
-        additional_context: Additional company/product context
+        product_description: Description of the product/service
+        known_competitors: List of known competitors if any
+        current_positioning: Current positioning if exists
 
     Returns:
-        JSON with ICP analysis including specificity scores
+        JSON with competitive frame options and recommendations
     """
-    return json.dumps({
-        "task": "icp_analysis",
-        "instructions": """Analyze ICP definition:
+    return json_extend(
+        _COMPETITIVE_FRAME_PREFIX,
+        product_description=product_description,
+        known_competitors=known_competitors,
+        current_positioning=current_positioning,
+    )
+
+
+# =============================================================================
+# ICP ANALYZER
+# =============================================================================
+
+_ICP_ANALYSIS_INSTRUCTIONS: Final[str] = """Analyze ICP definition:
 
 ## FIRMOGRAPHICS IDENTIFIED
 - Company Size: (specific or "all sizes"?)
@@ -631,46 +728,41 @@ Based on the asset, the implied ICP is:
 - What should be narrowed?
 - What's missing?
 
-## ICP CLARITY SCORE (0-100)""",
-        "asset_content": asset_content,
-        "additional_context": additional_context,
-    })
-
+## ICP CLARITY SCORE (0-100)"""
+_ICP_ANALYSIS_PREFIX = json_prefix(
+    task="icp_analysis",
+    instructions=_ICP_ANALYSIS_INSTRUCTIONS,
+    asset=ASSET_REFERENCE,
+)
 
-# =============================================================================
-# COMPLETE PMM AUDIT
-# =============================================================================
 
-@tool
-def run_complete_pmm_audit(
+@pmm_tool
+def analyze_icp(
     asset_content: str,
-    asset_type: Literal["homepage", "landing_page", "sales_deck", "email", "ad"] = "homepage",
-    asset_url: str | None = None,
-    company_context: str | None = None,
+    additional_context: str | None = None,
 ) -> str:
     """
-    Run a complete PMM audit covering all aspects.
-
-    This is the comprehensive tool that runs:
-    - 5-Second Test
-    - Positioning Analysis
-    - Messaging Analysis
-    - Homepage Structure (if applicable)
-    - Anti-Pattern Detection
-    - ICP Analysis
+    Analyze how well an asset defines and targets an Ideal Customer Profile.
 
     Args:
-        asset_content: The marketing asset to audit
-        asset_type: Type of asset
-        asset_url: URL if available
-        company_context: Additional context about the company
+        asset_content: Marketing asset to analyze
+        additional_context: Additional company/product context
 
     Returns:
-        JSON with complete audit including prioritized issues and recommendations
+        JSON with ICP analysis including specificity scores
     """
-    return json.dumps({
-        "task": "complete_pmm_audit",
-        "instructions": """Run complete PMM audit:
+    return json_extend(
+        _ICP_ANALYSIS_PREFIX,
+        asset_id=asset_id(asset_content),
+        additional_context=additional_context,
+    )
+
+
+# =============================================================================
+# COMPLETE PMM AUDIT
+# =============================================================================
+
+_COMPLETE_AUDIT_INSTRUCTIONS: Final[str] = """Run complete PMM audit:
 
 # PMM AUDIT REPORT
 
@@ -775,9 +867,52 @@ def run_complete_pmm_audit(
 ## NEXT STEPS
 1.
 2.
-3.""",
-        "asset_content": asset_content,
-        "asset_type": asset_type,
-        "asset_url": asset_url,
-        "company_context": company_context,
-    })
+3."""
+_COMPLETE_AUDIT_PREFIXES = MappingProxyType(
+    {
+        asset_type: json_prefix(
+            task="complete_pmm_audit",
+            instructions=_COMPLETE_AUDIT_INSTRUCTIONS,
+            asset=ASSET_REFERENCE,
+            asset_type=asset_type,
+        )
+        for asset_type in get_args(_AssetType)
+    }
+)
+
+
+@pmm_tool
+def run_complete_pmm_audit(
+    asset_content: str,
+    asset_type: _AssetType = "homepage",
+    asset_url: str | None = None,
+    company_context: str | None = None,
+) -> str:
+    """
+    Run a complete PMM audit covering all aspects.
+
+    This is the comprehensive tool that runs:
+    - 5-Second Test
+    - Positioning Analysis
+    - Messaging Analysis
+    - Homepage Structure (if applicable)
+    - Anti-Pattern Detection
+    - ICP Analysis
+
+    Args:
+        asset_content: The marketing asset to audit
+        asset_type: Type of asset
+        asset_url: URL if available
+        company_context: Additional context about the company
+
+    Returns:
+        JSON with complete audit including prioritized issues and recommendations
+    """
+    if asset_type not in _ASSET_TYPES:
+        raise ValueError(f"Unknown asset_type: {asset_type!r}")
+    return json_extend(
+        _COMPLETE_AUDIT_PREFIXES[asset_type],
+        asset_id=asset_id(asset_content),
+        asset_url=asset_url,
+        company_context=company_context,
+    )
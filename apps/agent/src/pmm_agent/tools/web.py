@@ -4,32 +4,13 @@ Web Fetching Tools for PMM Agent
 Tools for fetching and analyzing live websites and marketing assets.
 """
 
-import json
-from typing import Literal
-from langchain_core.tools import tool
+from types import MappingProxyType
+from typing import Final, Literal, get_args
 
+from pmm_agent.tools._decorators import pmm_tool
+from pmm_agent.tools._payload import footer, json_extend, json_format_prefix
 
-@tool
-def fetch_homepage(
-    url: str,
-    extract_mode: Literal["full", "above_fold", "hero_only"] = "full",
-) -> str:
-    """
-    Fetch a homepage URL and extract content for PMM analysis.
-
-    Args:
-        url: The URL to fetch
-        extract_mode: What portion to focus on
-            - full: Entire page
-            - above_fold: Estimated above-fold content
-            - hero_only: Just the hero section
-
-    Returns:
-        JSON with page content structured for PMM analysis
-    """
-    return json.dumps({
-        "task": "fetch_homepage",
-        "instructions": f"""Fetch and analyze the homepage at: {url}
+_FETCH_HOMEPAGE_INSTRUCTIONS: Final[str] = """Fetch and analyze the homepage at: {url}
 
 Extract and structure:
 
@@ -71,30 +52,50 @@ List every CTA on the page:
 - Meta description
 - Open Graph tags (if visible)
 
-Extract mode: {extract_mode}""",
-        "url": url,
-        "extract_mode": extract_mode,
-    })
+Extract mode: {extract_mode}"""
+_ExtractMode = Literal["full", "above_fold", "hero_only"]
+_EXTRACT_MODES: Final[frozenset[str]] = frozenset(get_args(_ExtractMode))
 
+# One pre-escaped template per extract mode; only the URL is filled per call
+_FETCH_HOMEPAGE_PREFIXES = MappingProxyType(
+    {
+        extract_mode: json_format_prefix(
+            _FETCH_HOMEPAGE_INSTRUCTIONS.format(url="{url}", extract_mode=extract_mode),
+            task="fetch_homepage",
+        )
+        for extract_mode in get_args(_ExtractMode)
+    }
+)
 
-@tool
-def fetch_competitor_homepage(
-    competitor_url: str,
-    your_url: str | None = None,
+
+@pmm_tool
+def fetch_homepage(
+    url: str,
+    extract_mode: _ExtractMode = "full",
 ) -> str:
     """
-    Fetch a competitor's homepage for comparative analysis.
+    Fetch a homepage URL and extract content for PMM analysis.
 
     Args:
-        competitor_url: The competitor's homepage URL
-        your_url: Your homepage URL for comparison (optional)
+        url: The URL to fetch
+        extract_mode: What portion to focus on
+            - full: Entire page
+            - above_fold: Estimated above-fold content
+            - hero_only: Just the hero section
 
     Returns:
-        JSON with competitor analysis structured for positioning comparison
+        JSON with page content structured for PMM analysis
     """
-    return json.dumps({
-        "task": "competitor_analysis",
-        "instructions": f"""Analyze competitor homepage: {competitor_url}
+    if extract_mode not in _EXTRACT_MODES:
+        raise ValueError(f"Unknown extract_mode: {extract_mode!r}")
+    return json_extend(
+        _FETCH_HOMEPAGE_PREFIXES[extract_mode](url=url),
+        url=url,
+        extract_mode=extract_mode,
+    )
+
+
+_COMPETITOR_HOMEPAGE_INSTRUCTIONS: Final[str] = """Analyze competitor homepage: {competitor_url}
 
 ## COMPETITOR POSITIONING
 - What do they claim to do?
@@ -127,30 +128,39 @@ Based on their positioning, you could:
 2.
 3.
 
-{f"Compare against your site: {your_url}" if your_url else ""}""",
-        "competitor_url": competitor_url,
-        "your_url": your_url,
-    })
+{comparison}"""
+_COMPETITOR_HOMEPAGE_PREFIX = json_format_prefix(
+    _COMPETITOR_HOMEPAGE_INSTRUCTIONS,
+    task="competitor_analysis",
+)
 
 
-@tool
-def analyze_landing_page(
-    url: str,
-    campaign_context: str | None = None,
+@pmm_tool
+def fetch_competitor_homepage(
+    competitor_url: str,
+    your_url: str | None = None,
 ) -> str:
     """
-    Analyze a landing page for conversion optimization.
+    Fetch a competitor's homepage for comparative analysis.
 
     Args:
-        url: The landing page URL
-        campaign_context: What campaign this supports (optional)
+        competitor_url: The competitor's homepage URL
+        your_url: Your homepage URL for comparison (optional)
 
     Returns:
-        JSON with landing page analysis focused on conversion
+        JSON with competitor analysis structured for positioning comparison
     """
-    return json.dumps({
-        "task": "landing_page_analysis",
-        "instructions": f"""Analyze landing page: {url}
+    return json_extend(
+        _COMPETITOR_HOMEPAGE_PREFIX(
+            competitor_url=competitor_url,
+            comparison=footer(("Compare against your site", your_url)),
+        ),
+        competitor_url=competitor_url,
+        your_url=your_url,
+    )
+
+
+_LANDING_PAGE_INSTRUCTIONS: Final[str] = """Analyze landing page: {url}
 
 ## MESSAGE MATCH
 - Does the headline match the likely ad/source?
@@ -199,28 +209,39 @@ Priority fixes:
 2.
 3.
 
-{f"Campaign context: {campaign_context}" if campaign_context else ""}""",
-        "url": url,
-        "campaign_context": campaign_context,
-    })
+{campaign}"""
+_LANDING_PAGE_PREFIX = json_format_prefix(
+    _LANDING_PAGE_INSTRUCTIONS,
+    task="landing_page_analysis",
+)
 
 
-@tool
-def scrape_social_proof(
+@pmm_tool
+def analyze_landing_page(
     url: str,
+    campaign_context: str | None = None,
 ) -> str:
     """
-    Extract and inventory all social proof from a page.
+    Analyze a landing page for conversion optimization.
 
     Args:
-        url: The URL to analyze
+        url: The landing page URL
+        campaign_context: What campaign this supports (optional)
 
     Returns:
-        JSON with comprehensive social proof inventory and assessment
+        JSON with landing page analysis focused on conversion
     """
-    return json.dumps({
-        "task": "social_proof_inventory",
-        "instructions": f"""Extract all social proof from: {url}
+    return json_extend(
+        _LANDING_PAGE_PREFIX(
+            url=url,
+            campaign=footer(("Campaign context", campaign_context)),
+        ),
+        url=url,
+        campaign_context=campaign_context,
+    )
+
+
+_SOCIAL_PROOF_INSTRUCTIONS: Final[str] = """Extract all social proof from: {url}
 
 ## LOGO BAR
 - Companies shown: [list all]
@@ -267,6 +288,27 @@ For each testimonial:
 - Quality:
 - Specificity:
 - Relevance:
-- **Overall:**""",
-        "url": url,
-    })
+- **Overall:**"""
+_SOCIAL_PROOF_PREFIX = json_format_prefix(
+    _SOCIAL_PROOF_INSTRUCTIONS,
+    task="social_proof_inventory",
+)
+
+
+@pmm_tool
+def scrape_social_proof(
+    url: str,
+) -> str:
+    """
+    Extract and inventory all social proof from a page.
+
+    Args:
+        url: The URL to analyze
+
+    Returns:
+        JSON with comprehensive social proof inventory and assessment
+    """
+    return json_extend(
+        _SOCIAL_PROOF_PREFIX(url=url),
+        url=url,
+    )
@@ -1,16 +1,12 @@
 """Pytest configuration and fixtures for PMM Agent tests."""
 
-import pytest
 import os
+from typing import Final
 
-# Set test environment
-os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
-
+import pytest
 
-@pytest.fixture
-def sample_homepage_content():
-    """Sample homepage content for testing PMM evaluation tools."""
-    return """
+# Sample assets are immutable strings, so one copy serves the whole session
+_SAMPLE_HOMEPAGE: Final[str] = """
     <html>
     <head><title>Acme Corp - Enterprise Solutions</title></head>
     <body>
@@ -21,11 +17,7 @@ def sample_homepage_content():
     </html>
     """
 
-
-@pytest.fixture
-def good_homepage_content():
-    """Well-structured homepage content that should pass PMM tests."""
-    return """
+_GOOD_HOMEPAGE: Final[str] = """
     <html>
     <head><title>CashIsClay - Train Your Team to Ship AI in 48 Hours</title></head>
     <body>
@@ -37,3 +29,25 @@ def good_homepage_content():
     </body>
     </html>
     """
+
+
+@pytest.fixture(scope="session")
+def sample_homepage_content():
+    """Sample homepage content for testing PMM evaluation tools."""
+    return _SAMPLE_HOMEPAGE
+
+
+@pytest.fixture(scope="session")
+def good_homepage_content():
+    """Well-structured homepage content that should pass PMM tests."""
+    return _GOOD_HOMEPAGE
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _anthropic_test_key():
+    """Provide a placeholder API key for the session, restoring the env after."""
+    previous = os.environ.get("ANTHROPIC_API_KEY")
+    os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
+    yield
+    if previous is None:
+        os.environ.pop("ANTHROPIC_API_KEY", None)
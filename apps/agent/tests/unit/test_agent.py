@@ -0,0 +1,215 @@
+"""Unit tests for the PMM agent factory.
+
+Testing Trophy Base Layer - Construction only, no model calls
+"""
+
+import importlib
+import subprocess
+import sys
+import time
+from collections import OrderedDict
+
+from pmm_agent.agent import (
+    DEFAULT_MODEL,
+    _canonical_url,
+    build_input,
+    create_pmm_agent,
+    get_model,
+)
+
+
+class TestAgentFactoryCache:
+    """Tests for reuse of compiled agents and model clients."""
+
+    def test_same_arguments_reuse_agent(self):
+        """Repeated calls with the same arguments return the same graph."""
+        assert create_pmm_agent(mode="evaluate") is create_pmm_agent(mode="evaluate")
+
+    def test_default_model_is_normalized(self):
+        """None and DEFAULT_MODEL resolve to the same cached graph."""
+        assert create_pmm_agent(model=None, mode="create") is create_pmm_agent(
+            model=DEFAULT_MODEL, mode="create"
+        )
+
+    def test_different_modes_build_different_agents(self):
+        """Each mode gets its own graph."""
+        assert create_pmm_agent(mode="evaluate") is not create_pmm_agent(mode="create")
+
+    def test_model_instances_are_shared(self):
+        """get_model returns one client per model name."""
+        assert get_model() is get_model(DEFAULT_MODEL)
+
+
+class TestPackageExports:
+    """Tests for the names exported by the pmm_agent package."""
+
+    def test_agent_export_is_the_default_graph(self):
+        """The `agent` export stays the graph after the submodule is imported."""
+        importlib.import_module("pmm_agent.agent")
+        from pmm_agent import agent
+
+        assert agent is create_pmm_agent()
+
+    def test_package_import_is_lazy(self):
+        """`import pmm_agent` loads neither the agent module nor LangChain tools."""
+        code = (
+            "import sys, pmm_agent; "
+            "assert 'pmm_agent.agent' not in sys.modules; "
+            "assert 'langchain_core.tools' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestBuildInput:
+    """Tests for the agent input builder."""
+
+    def test_single_user_message(self):
+        """Input holds one user message with the prompt as content."""
+        assert build_input("Analyze https://example.com") == {
+            "messages": [{"role": "user", "content": "Analyze https://example.com"}]
+        }
+
+    def test_calls_get_separate_lists(self):
+        """Identical prompts never share a mutable message list or dict."""
+        first = build_input("same prompt")
+        second = build_input("same prompt")
+        assert first["messages"] is not second["messages"]
+        assert first["messages"][0] is not second["messages"][0]
+
+    def test_prompt_whitespace_is_stripped(self):
+        """Surrounding whitespace does not produce a distinct prompt."""
+        assert build_input("  same prompt\n") == build_input("same prompt")
+
+    def test_long_prompt_has_no_cache_breakpoint(self):
+        """Long prompts stay plain strings; the middleware places breakpoints."""
+        prompt = "x" * 10_000
+        (message,) = build_input(prompt)["messages"]
+        assert message["content"] == prompt
+
+    def test_url_host_is_canonicalized(self):
+        """Scheme and host are lowercased; the path is left alone."""
+        assert _canonical_url(" HTTPS://Example.COM/Pricing ") == "https://example.com/Pricing"
+
+
+class TestCacheUsage:
+    """Tests for the prompt-cache usage summary."""
+
+    def test_sums_cache_reads_and_writes(self):
+        """Usage is summed over AI messages and billed at cache rates."""
+        from langchain_core.messages import AIMessage, HumanMessage
+
+        from pmm_agent.agent import cache_usage
+
+        def turn(input_tokens, creation, read):
+            return AIMessage(
+                "",
+                usage_metadata={
+                    "input_tokens": input_tokens,
+                    "output_tokens": 10,
+                    "total_tokens": input_tokens + 10,
+                    "input_token_details": {"cache_creation": creation, "cache_read": read},
+                },
+            )
+
+        usage = cache_usage([HumanMessage("hi"), turn(1000, 800, 0), turn(1200, 0, 800)])
+        assert usage == {
+            "input_tokens": 2200,
+            "cache_creation_tokens": 800,
+            "cache_read_tokens": 800,
+            "output_tokens": 20,
+            "billed_input_tokens": 600 + 800 * 1.25 + 800 * 0.1,
+        }
+
+
+class TestEvaluateHomepages:
+    """Tests for batched homepage evaluation."""
+
+    def test_batches_only_uncached_unique_urls(self, monkeypatch):
+        """Duplicates and cached URLs are not re-run; results keep input order."""
+        agent_module = importlib.import_module("pmm_agent.agent")
+
+        batched = []
+
+        class FakeAgent:
+            def batch(self, inputs, config):
+                batched.extend(inputs)
+                return [{"run": i} for i in range(len(inputs))]
+
+        monkeypatch.setattr(agent_module, "create_pmm_agent", lambda **kwargs: FakeAgent())
+        monkeypatch.setattr(agent_module, "_EVALUATION_CACHE", OrderedDict())
+        agent_module._store_evaluation(
+            ("https://cached.com", DEFAULT_MODEL), {"run": "cached"}, time.monotonic()
+        )
+
+        results = agent_module.evaluate_homepages(
+            ["https://A.com", "https://cached.com", "https://a.com", "https://b.com"]
+        )
+        assert results == [{"run": 0}, {"run": "cached"}, {"run": 0}, {"run": 1}]
+        assert len(batched) == 2
+
+    def test_cached_evaluation_skips_agent_construction(self, monkeypatch):
+        """A cache hit returns before any agent is built."""
+        agent_module = importlib.import_module("pmm_agent.agent")
+
+        def fail(**kwargs):
+            raise AssertionError("agent built for a cached evaluation")
+
+        monkeypatch.setattr(agent_module, "create_pmm_agent", fail)
+        monkeypatch.setattr(agent_module, "_EVALUATION_CACHE", OrderedDict())
+        agent_module._store_evaluation(
+            ("https://cached.com", DEFAULT_MODEL), {"run": "cached"}, time.monotonic()
+        )
+        assert agent_module.evaluate_homepage("https://Cached.com") == {"run": "cached"}
+
+    def test_cache_is_bounded_and_returns_copies(self, monkeypatch):
+        """Expired and least recently used entries are dropped; hits are copies."""
+        agent_module = importlib.import_module("pmm_agent.agent")
+        monkeypatch.setattr(agent_module, "_EVALUATION_CACHE", OrderedDict())
+        monkeypatch.setattr(agent_module, "EVALUATION_CACHE_SIZE", 2)
+        now = time.monotonic()
+        expired = now - agent_module.EVALUATION_CACHE_TTL
+
+        agent_module._store_evaluation(("https://old.com", "m"), {"run": 0}, expired)
+        assert agent_module._cached_evaluation(("https://old.com", "m")) is None
+        assert ("https://old.com", "m") not in agent_module._EVALUATION_CACHE
+
+        for run, url in enumerate(["https://a.com", "https://b.com", "https://c.com"]):
+            agent_module._store_evaluation((url, "m"), {"run": run}, now)
+        assert list(agent_module._EVALUATION_CACHE) == [
+            ("https://b.com", "m"),
+            ("https://c.com", "m"),
+        ]
+
+        agent_module._cached_evaluation(("https://b.com", "m"))["run"] = "mutated"
+        assert agent_module._cached_evaluation(("https://b.com", "m")) == {"run": 1}
+
+
+class TestSubagents:
+    """Tests for the specialist subagent records."""
+
+    def test_lookup_by_name(self):
+        """Every subagent is reachable by its name."""
+        from pmm_agent.subagents import PMM_SUBAGENTS, PMM_SUBAGENTS_BY_NAME
+
+        assert [PMM_SUBAGENTS_BY_NAME[s.name] for s in PMM_SUBAGENTS] == list(PMM_SUBAGENTS)
+
+    def test_all_lists_every_lazy_export(self):
+        """__all__ names exactly the exports the package resolves lazily."""
+        import pmm_agent.subagents as subagents
+
+        assert subagents.__all__ == list(subagents._EXPORTS)
+
+    def test_tool_set_matches_tools(self):
+        """tool_set holds the names of the ordered tools."""
+        from pmm_agent.subagents import PMM_SUBAGENTS_BY_NAME
+
+        icp = PMM_SUBAGENTS_BY_NAME["icp-analyst"]
+        assert icp.tool_set == {tool.name for tool in icp.tools}
+        assert icp.has_tool("analyze_icp")
+        assert not icp.has_tool("fetch_homepage")
+
+    def test_as_dict_resolves_prompt(self):
+        """as_dict gives deepagents a plain str system prompt."""
+        from pmm_agent.subagents import PMM_SUBAGENTS
+
+        assert all(isinstance(s.as_dict()["system_prompt"], str) for s in PMM_SUBAGENTS)
@@ -0,0 +1,34 @@
+"""Unit tests for the parallel subagent dispatch middleware.
+
+Testing Trophy Base Layer - No model calls
+"""
+
+import asyncio
+
+from langchain_core.messages import ToolMessage
+
+from pmm_agent.subagents.dispatch import SUBAGENT_TOOL_NAME, ParallelSubagentRouter
+
+
+class _Request:
+    tool_call = {"name": SUBAGENT_TOOL_NAME, "id": "call-1", "args": {}}
+
+
+class TestParallelSubagentRouter:
+    """Tests for the subagent concurrency cap."""
+
+    def test_cap_works_across_event_loops(self):
+        """One router can be contended from successive asyncio.run() loops."""
+        router = ParallelSubagentRouter(max_concurrency=1)
+
+        async def handler(request):
+            await asyncio.sleep(0)
+            return ToolMessage("done", tool_call_id=request.tool_call["id"])
+
+        async def contend():
+            return await asyncio.gather(
+                *[router.awrap_tool_call(_Request(), handler) for _ in range(3)]
+            )
+
+        for _ in range(2):
+            assert [m.content for m in asyncio.run(contend())] == ["done"] * 3
@@ -0,0 +1,55 @@
+"""Unit tests for the PMM evaluation models.
+
+Testing Trophy Base Layer - Schema validation only, no model calls
+"""
+
+import pytest
+
+
+class TestPositioningCanvasChoices:
+    """Tests for the canvas-specific choice fields."""
+
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [("alternative_type", "spreadsheets"), ("positioning_approach", "unclear")],
+    )
+    def test_shared_enum_values_are_rejected(self, field, value):
+        """The canvas keeps its narrower choices instead of the shared enums."""
+        from pmm_agent.models import PositioningCanvas
+
+        schema = PositioningCanvas.model_json_schema()
+        ref = schema["properties"][field]["$ref"].rsplit("/", 1)[-1]
+        assert value not in schema["$defs"][ref]["enum"]
+
+
+class TestSerialization:
+    """Tests for the dumped shape of the evaluation models."""
+
+    def test_model_dump_keeps_lists_and_choice_strings(self):
+        """List fields dump as lists; choice fields compare equal to their strings."""
+        from pmm_agent.models import MessagingLayer
+
+        layer = MessagingLayer(
+            layer_name="value_proposition", present=True, quality_score=60, issues=["Vague"]
+        )
+        dumped = layer.model_dump()
+        assert dumped["issues"] == ["Vague"]
+        assert dumped["layer_name"] == "value_proposition"
+        assert layer.model_dump(mode="json")["layer_name"] == "value_proposition"
+
+    def test_json_round_trip(self):
+        """A result survives model_dump_json() and model_validate_json() unchanged."""
+        from pmm_agent.models import MessagingHouse, PMMIssue
+
+        issue = PMMIssue(
+            category="messaging",
+            severity=3,
+            issue="No proof points",
+            why_it_matters="Claims go unbacked",
+            recommendation="Add customer metrics",
+        )
+        house = MessagingHouse(
+            pillars=["Speed", "Accuracy"], foundation_defined=True, structure_score=70
+        )
+        for model in (issue, house):
+            assert type(model).model_validate_json(model.model_dump_json()) == model
@@ -0,0 +1,77 @@
+"""Unit tests for prompt loading.
+
+Testing Trophy Base Layer - Package data only, no model calls
+"""
+
+import pytest
+
+from pmm_agent import prompts
+
+# sha256 of each prompt's original text after normalize_prompt(). The
+# evaluator also carries the "HOW YOU USE TOOLS" section on parallel tool
+# calls. Rewording a prompt is a deliberate change: update the hash with it.
+BASELINE_PROMPT_HASHES = {
+    "PMM_EVALUATOR_SYSTEM_PROMPT": "c56c3a1701e5011eadb87a3b010cc501d6a8c1e2e4561367b4826ba7582dd232",
+    "POSITIONING_ANALYST_PROMPT": "a66d3cfc5d981624dda472f68f2033f190008079f454fd58a5dcf44179922826",
+    "MESSAGING_ANALYST_PROMPT": "228c9f8ec777ad869c982866902c411e53f8325de9e500afbd269e784bcd76da",
+    "HOMEPAGE_ANALYST_PROMPT": "be5a84de1c7dffa8c50b45f694676745572ceaf75dd689966e51a8b9903ecc60",
+    "ANTI_PATTERN_DETECTOR_PROMPT": "43835d7ba83f02f6c9ebc7b45ab12f59d24d14c854aa51ddcaea35783f243b5d",
+    "ICP_ANALYST_PROMPT": "7124000789d9c2245395bd1a30cef26d0225940b56bf13b3645209e8d14d1bbe",
+    "COMPETITIVE_ANALYST_PROMPT": "aa228f0971781178f8b642d08fd158458aa00efd66cb2173fbd1a06a412b7cd7",
+}
+
+
+class TestPromptLoading:
+    """Tests for lazily loaded prompt text."""
+
+    @pytest.mark.parametrize("name", list(prompts._PROMPT_FILES))
+    def test_prompt_loads_without_placeholders(self, name):
+        """Every prompt loads with no template placeholders left in it."""
+        text = getattr(prompts, name)
+        assert text
+        assert "{{" not in text
+
+    @pytest.mark.parametrize("name", list(prompts._PROMPT_FILES))
+    def test_prompt_text_matches_baseline(self, name):
+        """Loading a prompt does not change the wording it was written with."""
+        import hashlib
+
+        digest = hashlib.sha256(getattr(prompts, name).encode("utf-8")).hexdigest()
+        assert digest == BASELINE_PROMPT_HASHES[name]
+
+    def test_unknown_attribute_raises(self):
+        """Names outside the prompt table are not resolved."""
+        with pytest.raises(AttributeError):
+            _ = prompts.NOT_A_PROMPT
+
+    def test_prompt_hash_matches_text(self):
+        """PROMPT_HASH holds the sha256 of each prompt's final text."""
+        import hashlib
+
+        expected = hashlib.sha256(prompts.ICP_ANALYST_PROMPT.encode("utf-8")).hexdigest()
+        assert prompts.PROMPT_HASH["ICP_ANALYST_PROMPT"] == expected
+        assert set(prompts.PROMPT_HASH) == set(prompts._PROMPT_FILES)
+
+
+class TestRubrics:
+    """Tests for the structured scoring rubrics."""
+
+    def test_positioning_rubric_matches_model_scores(self):
+        """Each positioning rubric item has a score field on PositioningStrategy."""
+        from pmm_agent.models import PositioningStrategy
+
+        fields = PositioningStrategy.model_fields
+        assert all(f"{key}_score" in fields for key in prompts.POSITIONING_RUBRIC)
+
+    def test_messaging_rubric_matches_model_scores(self):
+        """Each messaging rubric item has a score field on MessagingAnalysis."""
+        from pmm_agent.models import MessagingAnalysis
+
+        fields = MessagingAnalysis.model_fields
+        assert all(f"{key}_score" in fields for key in prompts.MESSAGING_RUBRIC)
+
+    def test_rubric_questions_appear_in_prompt(self):
+        """The structured rubric mirrors the evaluator prompt text."""
+        text = prompts.PMM_EVALUATOR_SYSTEM_PROMPT
+        for item in prompts.POSITIONING_RUBRIC.values():
+            assert all(question in text for question in item["questions"])
@@ -5,20 +5,60 @@ Testing Trophy Base Layer - Pure function tests
 
 import pytest
 
+FIVE_SECOND_CRITERIA = [
+    "What do they do?",
+    "Who is it for?",
+    "What makes it different?",
+    "What should I do next?",
+]
+POSITIONING_ELEMENTS = [
+    "competitive_alternatives",
+    "unique_attributes",
+    "value",
+    "target_customers",
+    "market_category",
+]
+MESSAGING_LAYERS = [
+    "strategic_narrative",
+    "positioning_statement",
+    "value_propositions",
+    "proof_points",
+    "micro_copy",
+]
+CRITICAL_ANTI_PATTERNS = [
+    "no_competitive_frame",
+    "missing_target_audience",
+    "vague_value_proposition",
+    "no_clear_cta",
+]
+
+
+class TestFrameworkChecklists:
+    """Tests for the PMM framework checklists."""
+
+    @pytest.mark.parametrize(
+        ("items", "expected_len", "first", "last"),
+        [
+            # 5-second test checks 4 things
+            (FIVE_SECOND_CRITERIA, 4, None, None),
+            # All 5 April Dunford positioning elements
+            (POSITIONING_ELEMENTS, 5, None, None),
+            # Fletch messaging hierarchy: strategic narrative first, micro-copy last
+            (MESSAGING_LAYERS, 5, "strategic_narrative", "micro_copy"),
+            (CRITICAL_ANTI_PATTERNS, 4, None, None),
+        ],
+        ids=["five_second_criteria", "positioning_elements", "messaging_layers", "anti_patterns"],
+    )
+    def test_checklist_shape(self, items, expected_len, first, last):
+        """Each checklist has its expected length and, where set, its end points."""
+        assert len(items) == expected_len
+        assert first is None or items[0] == first
+        assert last is None or items[-1] == last
+
 
 class TestFiveSecondTestCriteria:
     """Tests for 5-second test evaluation criteria."""
 
-    def test_criteria_list_is_complete(self):
-        """5-second test should check 4 things."""
-        criteria = [
-            "What do they do?",
-            "Who is it for?",
-            "What makes it different?",
-            "What should I do next?",
-        ]
-        assert len(criteria) == 4
-
     def test_pass_threshold(self):
         """Should require 4/4 to pass."""
         pass_threshold = 4
@@ -28,17 +68,6 @@ class TestFiveSecondTestCriteria:
 class TestPositioningFramework:
     """Tests for April Dunford positioning framework."""
 
-    def test_positioning_elements(self):
-        """Positioning should include all 5 April Dunford elements."""
-        elements = [
-            "competitive_alternatives",
-            "unique_attributes",
-            "value",
-            "target_customers",
-            "market_category",
-        ]
-        assert len(elements) == 5
-
     def test_scoring_scale(self):
         """Scores should be 0-100."""
         min_score = 0
@@ -47,42 +76,184 @@ class TestPositioningFramework:
         assert max_score == 100
 
 
-class TestMessagingHierarchy:
-    """Tests for Fletch PMM messaging hierarchy."""
+class TestAntiPatterns:
+    """Tests for PMM anti-pattern detection."""
 
-    def test_messaging_layers(self):
-        """Messaging hierarchy should have 5 layers."""
-        layers = [
-            "strategic_narrative",
-            "positioning_statement",
-            "value_propositions",
-            "proof_points",
-            "micro_copy",
-        ]
-        assert len(layers) == 5
-
-    def test_layers_are_ordered(self):
-        """Strategic narrative should be first, micro-copy last."""
-        layers = [
-            "strategic_narrative",
-            "positioning_statement",
-            "value_propositions",
-            "proof_points",
-            "micro_copy",
-        ]
-        assert layers[0] == "strategic_narrative"
-        assert layers[-1] == "micro_copy"
+    def test_sign_phrases_found_in_one_scan(self):
+        """Sign phrases are matched case-insensitively and grouped by anti-pattern."""
+        from pmm_agent.tools.evaluation import scan_anti_pattern_signs
 
+        hits = scan_anti_pattern_signs(
+            "Our AI-powered, next-generation platform. We do everything. ai-powered!"
+        )
+        assert hits == {
+            "jargon_buzzwords": ["AI-powered", "next-generation"],
+            "platform_before_point_solution": ["We do everything"],
+        }
 
-class TestAntiPatterns:
-    """Tests for PMM anti-pattern detection."""
+    def test_sign_scan_handles_length_changing_lowercase(self):
+        """Phrases are reported verbatim even when lowercasing shifts offsets."""
+        from pmm_agent.tools.evaluation import scan_anti_pattern_signs
+
+        hits = scan_anti_pattern_signs("İstanbul teams love our Next-Generation suite")
+        assert hits == {"jargon_buzzwords": ["Next-Generation"]}
+
+    def test_sign_scan_maps_case_folded_matches_to_their_phrase(self):
+        """Matches that don't lowercase to the phrase (e.g. "ſ") still resolve."""
+        from pmm_agent.tools.evaluation import scan_anti_pattern_signs
+
+        hits = scan_anti_pattern_signs("İstanbul teams love our ſynergistic suite")
+        assert hits == {"jargon_buzzwords": ["ſynergistic"]}
+
+
+class TestToolInstructions:
+    """Tests for the static instruction prefix in tool results."""
+
+    def test_instructions_are_identical_across_calls(self):
+        """Per-call arguments never leak into evaluation instructions."""
+        import json
+
+        from pmm_agent.tools.evaluation import analyze_positioning
+
+        first = json.loads(analyze_positioning.invoke({"asset_content": "A"}))
+        second = json.loads(analyze_positioning.invoke({"asset_content": "B"}))
+        assert first["instructions"] == second["instructions"]
+        assert list(first).index("instructions") < list(first).index("asset_id")
+
+    def test_asset_is_referenced_not_echoed(self):
+        """Evaluation results carry a shared asset_id instead of the content."""
+        import json
 
-    def test_critical_anti_patterns(self):
-        """Should detect critical anti-patterns."""
-        critical_patterns = [
-            "no_competitive_frame",
-            "missing_target_audience",
-            "vague_value_proposition",
-            "no_clear_cta",
+        from pmm_agent.tools import analyze_messaging, run_five_second_test
+
+        asset = "Payroll software for independent veterinary clinics"
+        results = [
+            json.loads(pmm_tool.invoke({"asset_content": asset}))
+            for pmm_tool in (analyze_messaging, run_five_second_test)
         ]
-        assert len(critical_patterns) >= 3
+        assert results[0]["asset_id"] == results[1]["asset_id"]
+        assert all(asset not in json.dumps(result) for result in results)
+
+    def test_creation_arguments_trail_the_template(self):
+        """Creation tools append provided arguments after the static template."""
+        import json
+
+        from pmm_agent.tools.creation import (
+            _POSITIONING_CANVAS_INSTRUCTIONS,
+            create_positioning_canvas,
+        )
+
+        result = json.loads(
+            create_positioning_canvas.invoke(
+                {
+                    "product_description": "Payroll for clinics",
+                    "target_audience": "Clinic managers",
+                }
+            )
+        )
+        assert result["instructions"] == (
+            _POSITIONING_CANVAS_INSTRUCTIONS
+            + "Product: Payroll for clinics\nTarget: Clinic managers"
+        )
+
+    async def test_tools_have_native_coroutines(self):
+        """ainvoke() runs the tool directly and matches invoke()."""
+        from pmm_agent.tools import analyze_icp, fetch_homepage
+
+        for pmm_tool, args in (
+            (analyze_icp, {"asset_content": "Payroll for clinics"}),
+            (fetch_homepage, {"url": "https://example.com"}),
+        ):
+            assert pmm_tool.coroutine is not None
+            assert await pmm_tool.ainvoke(args) == pmm_tool.invoke(args)
+
+    def test_asset_id_ignores_whitespace_changes(self):
+        """Re-audits of the same copy with different spacing share an asset_id."""
+        from pmm_agent.tools._payload import asset_id
+
+        assert asset_id("Payroll  for\n clinics ") == asset_id("Payroll for clinics")
+        assert asset_id("Payroll for clinics") != asset_id("Payroll for vets")
+
+    def test_repeat_calls_hit_the_result_cache(self):
+        """Identical arguments, list arguments included, reuse the cached result."""
+        from pmm_agent.tools import generate_differentiation_statements
+
+        args = {
+            "product_description": "Payroll for clinics",
+            "competitive_alternative": "Spreadsheets",
+            "unique_capabilities": ["Shift-aware pay runs"],
+        }
+        hits = generate_differentiation_statements.func.cache_info().hits
+        first = generate_differentiation_statements.invoke(args)
+        assert generate_differentiation_statements.invoke(args) == first
+        assert generate_differentiation_statements.func.cache_info().hits == hits + 1
+        assert "Capabilities: ['Shift-aware pay runs']" in first
+
+    def test_whitespace_variants_hit_the_result_cache(self):
+        """Re-pasted asset copy with different spacing is served from the cache."""
+        from pmm_agent.tools import analyze_icp
+
+        first = analyze_icp.invoke({"asset_content": "Payroll  for\n clinics "})
+        hits = analyze_icp.func.cache_info().hits
+        assert analyze_icp.invoke({"asset_content": "Payroll for clinics"}) == first
+        assert analyze_icp.func.cache_info().hits == hits + 1
+
+    def test_clear_tool_caches_empties_every_cache(self):
+        """clear_tool_caches drops memoized results across all tools."""
+        from pmm_agent.tools import analyze_icp, clear_tool_caches, scrape_social_proof
+
+        analyze_icp.invoke({"asset_content": "Payroll for clinics"})
+        scrape_social_proof.invoke({"url": "https://example.com"})
+        clear_tool_caches()
+        assert analyze_icp.func.cache_info().currsize == 0
+        assert scrape_social_proof.func.cache_info().currsize == 0
+
+    def test_payload_prefix_matches_whole_dict_encoding(self):
+        """Pre-serialized prefixes splice into the same bytes as one encode."""
+        from pmm_agent.tools._payload import (
+            _dumps,
+            json_extend,
+            json_extend_text,
+            json_prefix,
+            json_text_prefix,
+        )
+
+        prefix = json_prefix(task="t", instructions='Static "markdown"')
+        assert json_extend(prefix, asset="ä") == _dumps(
+            {"task": "t", "instructions": 'Static "markdown"', "asset": "ä"}
+        )
+        text_prefix = json_text_prefix(task="t", instructions="Static\n")
+        assert json_extend_text(text_prefix, "Product: ü", product="ü") == _dumps(
+            {"task": "t", "instructions": "Static\nProduct: ü", "product": "ü"}
+        )
+
+    def test_payload_bytes_match_orjson(self):
+        """The stdlib fallback encodes exactly what orjson does."""
+        orjson = pytest.importorskip("orjson")
+        from pmm_agent.tools._payload import _JSON_ENCODER
+
+        value = {"text": 'ä "q" \\ \n\t\x00\x1f 😀', "items": [1, True, None, 0.1, "é"]}
+        assert _JSON_ENCODER.encode(value) == orjson.dumps(value).decode()
+
+    def test_format_prefix_escapes_only_filled_values(self):
+        """Templated instructions splice into the same bytes as one encode."""
+        from pmm_agent.tools._payload import _dumps, json_extend, json_format_prefix
+
+        render = json_format_prefix('Fetch: {url}\nMode "{mode}"', task="t")
+        url = 'https://example.com/?q="ü"'
+        assert json_extend(render(url=url, mode="full"), url=url) == _dumps(
+            {
+                "task": "t",
+                "instructions": f'Fetch: {url}\nMode "full"',
+                "url": url,
+            }
+        )
+
+    def test_unknown_choice_raises_value_error(self):
+        """Direct calls with an unknown Literal value fail before building a result."""
+        from pmm_agent.tools import fetch_homepage, run_five_second_test
+
+        with pytest.raises(ValueError, match="asset_type"):
+            run_five_second_test.func("Payroll for clinics", asset_type="poster")
+        with pytest.raises(ValueError, match="extract_mode"):
+            fetch_homepage.func("https://example.com", extract_mode="footer")